@@ -2,7 +2,7 @@ bl_info = {
     "name": "dev tools",
     "description": "Add tools in text editor and console to help development",
     "author": "Samuel Bernou",
-    "version": (3, 2, 1),
+    "version": (3, 3, 0),
     "blender": (3, 0, 0),
     "location": "Text editor > toolbar and console header",
     "doc_url": "https://github.com/Pullusb/devTools",
@@ -21,10 +21,14 @@ from pathlib import Path
 from . import fn
 from . import utility_ops
 from . import addon_listing
+from . import addon_profiler
+from . import addon_watcher
 from . import openers
 from . import install_pip_modules
 from . import error_handle
 from . import api_explore
+from . import api_snapshot
+from . import ops_catalog
 from . import console_ops
 from . import run_script_in_viewport
 from . import ui
@@ -1030,6 +1034,8 @@ def register():
     install_pip_modules.register()
     error_handle.register()
     api_explore.register()
+    api_snapshot.register()
+    ops_catalog.register()
     for cls in classes:
         bpy.utils.register_class(cls)
         
@@ -1057,6 +1063,8 @@ def register():
     console_ops.register()
     run_script_in_viewport.register()
     addon_listing.register()
+    addon_profiler.register()
+    addon_watcher.register()
     ui.register()
 
 def unregister():
@@ -1064,7 +1072,11 @@ def unregister():
         return
 
     ui.unregister()
+    addon_watcher.unregister()
+    addon_profiler.unregister()
     addon_listing.unregister()
+    ops_catalog.unregister()
+    api_snapshot.unregister()
     api_explore.unregister()
 
     error_handle.unregister()
@@ -0,0 +1,235 @@
+import os
+import ast
+import re
+import json
+import time
+import addon_utils
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+from . import fn
+
+CACHE_FORMAT = 1 # increment when cached infos layout changes
+CACHE_FILENAME = 'addon_infos.json'
+
+_cache = None # path : {'stamp': [...], 'info': [...]}, loaded once per session
+
+class AddonInfo(NamedTuple):
+    '''Addon metadata, read from bl_info or from blender_manifest.toml for extensions'''
+    path: str # module file (__init__.py for multi-file addons)
+    module: str # module name (prefixed with "bl_ext.<repo>" for extensions)
+    name: str
+    support: str
+    version: tuple
+    category: str
+    manifest: dict # manifest fields for extensions, empty for legacy addons
+
+
+def get_addon_roots() -> list:
+    '''Return list of (directory, package prefix) where addons are searched (same as addon_utils.modules)'''
+    paths_with_repos = getattr(addon_utils, '_paths_with_extension_repos', None)
+    if paths_with_repos:
+        return list(paths_with_repos())
+    return [(p, '') for p in addon_utils.paths()]
+
+def list_root_modules(root, package=''):
+    '''Yield (module name, module file) found in directory, same rules as bpy.path.module_names'''
+    prefix = f'{package}.' if package else ''
+    try:
+        entries = sorted(os.scandir(root), key=lambda e: e.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.name == 'modules':
+            continue
+        if entry.name.endswith('.py') and entry.name != '__init__.py':
+            yield prefix + entry.name[:-3], entry.path
+        elif not entry.name.startswith('.') and entry.is_dir():
+            yield prefix + entry.name, os.path.join(entry.path, '__init__.py')
+
+def get_mtime(path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+def get_stamp(module_path) -> list:
+    '''Return [file mtime, directory mtime, manifest mtime] used to detect changes
+    File mtime is 0 when module file does not exist'''
+    stamp = [get_mtime(module_path), 0, 0]
+    if stamp[0] and os.path.basename(module_path) == '__init__.py':
+        folder = os.path.dirname(module_path)
+        stamp[1] = get_mtime(folder)
+        stamp[2] = get_mtime(os.path.join(folder, 'blender_manifest.toml'))
+    return stamp
+
+## bl_info parsing
+
+re_bl_info = re.compile(r'^bl_info\s*=\s*', re.MULTILINE)
+
+def read_bl_info(module_path) -> dict:
+    '''Return bl_info dict of an addon file without importing it, empty dict if not found
+    Only the bl_info block is evaluated when it ends with a closing brace at line start'''
+    try:
+        with open(module_path, 'r', encoding='utf-8', errors='replace') as fd:
+            text = fd.read()
+    except OSError:
+        return {}
+
+    res = re_bl_info.search(text)
+    if not res:
+        return {}
+
+    ## fast path: literal block up to first closing brace at line start
+    end = text.find('\n}', res.end())
+    if end != -1:
+        try:
+            bl_info = ast.literal_eval(text[res.end():end + 2])
+            if isinstance(bl_info, dict):
+                return bl_info
+        except (ValueError, TypeError, SyntaxError, RecursionError, MemoryError):
+            pass
+
+    ## fallback: parse whole file
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == 'bl_info' for t in node.targets)):
+            try:
+                bl_info = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError, RecursionError):
+                return {}
+            return bl_info if isinstance(bl_info, dict) else {}
+    return {}
+
+def read_manifest(folder) -> dict:
+    '''Return content of blender_manifest.toml in folder, empty dict if not found'''
+    manifest_path = os.path.join(folder, 'blender_manifest.toml')
+    if not os.path.isfile(manifest_path):
+        return {}
+    try:
+        import tomllib
+    except ImportError:
+        tomllib = None
+
+    try:
+        if tomllib is None:
+            ## Python < 3.11, only read top level string fields
+            with open(manifest_path, 'r', encoding='utf-8', errors='replace') as fd:
+                text = fd.read()
+            return dict(re.findall(r'^(\w+)\s*=\s*"(.*?)"', text, re.MULTILINE))
+        with open(manifest_path, 'rb') as fd:
+            return tomllib.load(fd)
+    except (OSError, ValueError):
+        return {}
+
+def parse_version(version) -> tuple:
+    if isinstance(version, str):
+        return tuple(int(v) if v.isdigit() else v for v in version.split('.'))
+    return tuple(version or ())
+
+def read_addon_info(module, module_path):
+    '''Read metadata from disk, None when module is not a valid addon'''
+    manifest = {}
+    if os.path.basename(module_path) == '__init__.py':
+        manifest = read_manifest(os.path.dirname(module_path))
+
+    if manifest:
+        keep = ('id', 'name', 'version', 'tagline', 'maintainer', 'type', 'blender_version_min', 'license')
+        manifest = {k: v for k, v in manifest.items() if k in keep}
+        return AddonInfo(module_path, module, manifest.get('name', ''), 'COMMUNITY',
+                         parse_version(manifest.get('version', '')), '', manifest)
+
+    bl_info = read_bl_info(module_path)
+    if not bl_info:
+        return None
+    return AddonInfo(module_path, module, bl_info.get('name', ''), bl_info.get('support', 'COMMUNITY'),
+                     parse_version(bl_info.get('version', ())), bl_info.get('category', ''), {})
+
+## Disk cache
+
+def load_cache() -> dict:
+    cache_file = fn.get_cache_dir() / CACHE_FILENAME
+    if not cache_file.exists():
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as fd:
+            data = json.load(fd)
+    except (OSError, ValueError) as e:
+        print(f'Could not read addon cache {cache_file}: {e}')
+        return {}
+    if data.get('format') != CACHE_FORMAT:
+        return {}
+    return data.get('entries', {})
+
+def save_cache(entries):
+    cache_file = fn.get_cache_dir() / CACHE_FILENAME
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as fd:
+            json.dump({'format': CACHE_FORMAT, 'entries': entries}, fd, separators=(',', ':'))
+    except OSError as e:
+        print(f'Could not write addon cache {cache_file}: {e}')
+
+def get_addon_infos(refresh=False, max_workers=8) -> list:
+    '''Return list of AddonInfo of all addons found in scripts directories and extensions repositories
+    sorted like addon_utils.modules (category, name)
+    Metadata is read from disk only for addons whose file, folder or manifest mtime changed,
+    on a thread pool (network shares are mostly waiting on I/O)
+    refresh: ignore cached metadata and read everything again
+    '''
+    global _cache
+    if _cache is None:
+        _cache = load_cache()
+    if refresh:
+        _cache = {}
+
+    start = time.perf_counter()
+    candidates = []
+    for root, package in get_addon_roots():
+        candidates.extend(list_root_modules(root, package))
+
+    def resolve(candidate):
+        module, module_path = candidate
+        stamp = get_stamp(module_path)
+        if not stamp[0]:
+            return module, module_path, None, False
+        cached = _cache.get(module_path)
+        ## entries of files that are not addons (info None) are cache hits too
+        if cached and cached['stamp'] == stamp and (cached['info'] is None or cached['info'][1] == module):
+            return module, module_path, cached, False
+        info = read_addon_info(module, module_path)
+        return module, module_path, {'stamp': stamp, 'info': list(info) if info else None}, True
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(resolve, candidates))
+
+    entries = {}
+    infos = []
+    misses = 0
+    seen_modules = set()
+    for module, module_path, entry, missed in results:
+        if entry is None:
+            ## folder without __init__.py, does not hide same name in next roots
+            continue
+        misses += missed
+        entries[module_path] = entry
+        ## first found wins on module name conflict (like addon_utils)
+        if module in seen_modules:
+            continue
+        seen_modules.add(module)
+        if entry['info']:
+            path, module, name, support, version, category, manifest = entry['info']
+            infos.append(AddonInfo(path, module, name, support, tuple(version), category, manifest))
+
+    ## do not keep entries of removed addons
+    if misses or len(entries) != len(_cache):
+        _cache = entries
+        save_cache(entries)
+
+    infos.sort(key=lambda i: (i.category, i.name))
+    if misses:
+        print(f'Addon infos: {len(infos)} addons, {misses} read from disk ({time.perf_counter() - start:.2f}s)')
+    return infos
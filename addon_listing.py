@@ -1,5 +1,5 @@
-from typing import DefaultDict
-import bpy, os, re, fnmatch
+from collections import defaultdict
+import bpy, os, fnmatch
 import addon_utils
 import time
 from bpy_extras.io_utils import ExportHelper
@@ -8,11 +8,15 @@ import zipfile
 from pathlib import Path
 
 from . import fn
+from . import addon_cache
+from . import fuzzy_search
+from . import addon_zip
 from bpy.props import (
                     StringProperty,
                     BoolProperty,
                     EnumProperty,
                     IntProperty,
+                    FloatProperty,
                     CollectionProperty,
                     )
 
@@ -25,27 +29,49 @@ from bpy.types import (
                     Panel
                     )
 
-def get_addon_location(fp) -> str:
-    '''get addon filepath and return a name of the addon location'''
+def get_location_roots() -> dict:
+    '''Return dict of addons root directory : location name
+    Computed once and matched against addon parent directory
+    '''
+    roots = {}
+    def add_root(path, name):
+        if path:
+            roots.setdefault(os.path.normcase(os.path.normpath(str(path))), name)
 
-    if fp.startswith( str(Path(bpy.utils.user_resource('SCRIPTS')) / 'addons') ):
-        return 'user'
+    add_root(Path(bpy.utils.user_resource('SCRIPTS')) / 'addons', 'user')
 
-    if fp.startswith( str(Path(bpy.utils.resource_path('LOCAL')) / 'scripts' / 'addons') ):
-        return 'native'
+    native_scripts = Path(bpy.utils.resource_path('LOCAL')) / 'scripts'
+    for folder in ('addons', 'addons_core', 'addons_contrib'):
+        add_root(native_scripts / folder, 'native')
 
     if bpy.app.version < (3, 6, 0):
         external_scripts = bpy.context.preferences.filepaths.script_directory
         if external_scripts:
-            if fp.startswith( str(Path(external_scripts)) ):
-                return 'external'
+            add_root(Path(external_scripts) / 'addons', 'external')
     else:
-        external_scripts = bpy.context.preferences.filepaths.script_directories
-        for s in external_scripts:
-            if s.directory and fp.startswith( str(Path(s.directory)) ):
-                return 'external'
+        for s in bpy.context.preferences.filepaths.script_directories:
+            if s.directory:
+                add_root(Path(s.directory) / 'addons', 'external')
+
+    ## Blender 4.2+ extensions repositories
+    paths_with_repos = getattr(addon_utils, '_paths_with_extension_repos', None)
+    if paths_with_repos:
+        for path, package in paths_with_repos():
+            if package:
+                add_root(path, 'extension')
+
+    return roots
+
+def get_addon_location(fp, roots=None) -> str:
+    '''get addon filepath and return a name of the addon location
+    roots: dict from get_location_roots (computed if not passed)
+    '''
+    if roots is None:
+        roots = get_location_roots()
 
-    return 'other'
+    fp = os.path.normpath(str(fp))
+    addon_dir = os.path.dirname(fp) if os.path.basename(fp) == '__init__.py' else fp
+    return roots.get(os.path.normcase(os.path.dirname(addon_dir)), 'other')
 
 def get_addons_modules_infos(active_filter="ALL", support_filter='ALL', extra=False):
     '''Return a list of tuples
@@ -56,24 +82,18 @@ def get_addons_modules_infos(active_filter="ALL", support_filter='ALL', extra=Fa
 
     addon_list = []
     module_list = []
-    remodule = re.compile(r"<module '(.*?)' from '(.*?)'>")
-    
-    for i, m in enumerate(addon_utils.modules()):
-        n = m.bl_info.get('name','')
 
-        res = remodule.search(str(m))
-        if not res:
-            continue
-        
-        support = m.bl_info.get('support','COMMUNITY') # default is community
-        version = m.bl_info.get('version','') # version to string
+    ## metadata read from disk cache, only changed addons are parsed again
+    for m in addon_cache.get_addon_infos():
+        n = m.name
+        support = m.support or 'COMMUNITY' # default is community
+        version = m.version # version to string
         if version:
             version = '.'.join([str(i) for i in version])
         else:
             version = ''
 
-        diskname, fp = res.group(1), Path(res.group(2))
-        
+        diskname, fp = m.module, Path(m.path)
 
         if not diskname or not n or not fp:
             continue
@@ -96,18 +116,21 @@ def get_addons_modules_infos(active_filter="ALL", support_filter='ALL', extra=Fa
         else:
             addon_list.append((str(fp), n, diskname))
 
-        # module (can access m.bl_info['version']...etc)
+        # addon infos (can access m.version...etc)
         module_list.append(m)
 
     ## / treat duplicate name (check for infos on conflict)
-    # find duplicate indexes
-    namelist = [x[1] for x in addon_list]
-    dup_index = list(set(i for i, x in enumerate(namelist) if namelist.count(x) > 1))
+    # find duplicate indexes, grouped by name in one pass
+    name_groups = defaultdict(list)
+    for i, x in enumerate(addon_list):
+        name_groups[x[1]].append(i)
+    dup_index = [i for indexes in name_groups.values() if len(indexes) > 1 for i in indexes]
 
     # Add version and location name
+    roots = get_location_roots() if dup_index else {}
     for idx in dup_index:
-        loc = get_addon_location(addon_list[idx][0])
-        version = str(module_list[idx].bl_info.get('version', '')).replace(" ", "").strip('()')
+        loc = get_addon_location(addon_list[idx][0], roots)
+        version = str(module_list[idx].version).replace(" ", "").strip('()')
         # replace with new tuple
         if extra:
             addon_list[idx] = (addon_list[idx][0], f'{addon_list[idx][1]} ({loc} {version})', addon_list[idx][2], addon_list[idx][3], version)
@@ -125,8 +148,9 @@ def reload_addon_list(self, context):
     uilist.clear()
     pl_prop['idx'] = 0 # reset idx to zero
 
+    ## Load full list, state and support filters are applied in UI list filter_items
     ## Need extra to have support and version
-    addon_tuples = get_addons_modules_infos(active_filter=pl_prop.filter_state, support_filter=pl_prop.filter_support, extra=True)
+    addon_tuples = get_addons_modules_infos(extra=True)
     # [0] diskpath, [1] bl_info name, [2] Diskname, [3] Support
 
     for adn in addon_tuples: # populate list
@@ -138,12 +162,15 @@ def reload_addon_list(self, context):
         item.addon_support = adn[3]
         item.addon_version = adn[4]
 
+    filter_memo.invalidate()
+    invalidate_addon_enum_cache()
     scn.devpack_props.idx = len(uilist) - 1 # trigger update
 
 class DEV_OT_reload_addon_list(Operator):
     bl_idname = "dev.reload_addon_list"
-    bl_label = "Reload Palette Blends"
-    bl_description = "Reload the blends in UI list of palettes linker"
+    bl_label = "Reload Addon List"
+    bl_description = "Rescan addons on disk and reload the list\
+        \nSupport and state filters do not need a reload"
     bl_options = {"REGISTER", "INTERNAL"}
 
     def execute(self, context):
@@ -152,6 +179,53 @@ class DEV_OT_reload_addon_list(Operator):
 
 #--- UI List
 
+class AddonFilterMemo:
+    '''Search keys of addon list items and last filter result
+    generation is incremented on list reload to invalidate everything
+    '''
+
+    def __init__(self):
+        self.generation = 0
+        self.items_key = None
+        self.items = [] # (name, module, name key, module key, support, enable time) per item
+        self.signature = None
+        self.result = ([], [])
+
+    def invalidate(self):
+        self.generation += 1
+
+    def get_items(self, data, collec) -> list:
+        items_key = (self.generation, data.as_pointer(), len(collec))
+        if items_key != self.items_key:
+            self.items = [(item.name, item.addon_module, fuzzy_search.normalize(item.name),
+                           fuzzy_search.normalize(item.addon_module), item.addon_support, item.time_total)
+                          for item in collec]
+            self.items_key = items_key
+        return self.items
+
+filter_memo = AddonFilterMemo()
+
+def get_marked_addons(context) -> list:
+    '''Return marked items of addon list, except the ones hidden by support and state filters
+    (name filter only helps to find items, marked items stay active while searching)'''
+    pl_prop = context.scene.devpack_props
+    filter_support = pl_prop.filter_support
+    filter_state = pl_prop.filter_state
+    enabled = {a.module for a in context.preferences.addons}
+    marked = []
+    for ad in pl_prop.addon_list:
+        if not ad.select:
+            continue
+        if filter_support != 'ALL' and ad.addon_support != filter_support:
+            continue
+        if filter_state == 'ACTIVE' and ad.addon_module not in enabled:
+            continue
+        if filter_state == 'INACTIVE' and ad.addon_module in enabled:
+            continue
+        marked.append(ad)
+    return marked
+
+
 class DEV_UL_addon_list(UIList):
 
     show_diskname : BoolProperty(name="Show Diskname", default=False,
@@ -160,6 +234,12 @@ class DEV_UL_addon_list(UIList):
     show_version : BoolProperty(name="Show Version", default=False,
     description="display version in additional column")
 
+    show_timing : BoolProperty(name="Show Enable Time", default=False,
+    description="display enable time measured by profiler in additional column")
+
+    sort_by_time : BoolProperty(name="Sort By Enable Time", default=False,
+    description="sort addons by enable time measured by profiler, slowest first")
+
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
         # self.use_filter_show = True # force open the search feature
         row = layout.row(align=True)
@@ -169,6 +249,11 @@ class DEV_UL_addon_list(UIList):
             row.label(text=item.addon_module)
         if self.show_version:
             row.label(text=item.addon_version)
+        if self.show_timing:
+            if item.profile_error:
+                row.label(text='error', icon='ERROR')
+            else:
+                row.label(text=f'{item.time_total * 1000:.0f} ms' if item.time_total else '')
         # row.operator('dev.open_element_in_os', text='', icon='FILE_FOLDER').filepath = item.addon_path
         # row.operator('dev.open_addon_in_code_editor', text='', icon='FILE_SCRIPT').filepath = item.addon_path
 
@@ -180,6 +265,8 @@ class DEV_UL_addon_list(UIList):
         # reverse order
         subrow.prop(self, "show_diskname", text="", icon='SYNTAX_OFF') # built-in reverse
         subrow.prop(self, "show_version", text="", icon='QUESTION') # built-in reverse
+        subrow.prop(self, "show_timing", text="", icon='TIME')
+        subrow.prop(self, "sort_by_time", text="", icon='SORTTIME')
         icon = 'SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC'
         subrow.prop(self, "use_filter_sort_reverse", text="", icon=icon) # built-in reverse
 
@@ -188,18 +275,65 @@ class DEV_UL_addon_list(UIList):
 
         flt_flags = []
         flt_neworder = []
-        if self.filter_name:
-            ## Case sensitive 
-            # helper_funcs = bpy.types.UI_UL_list
-            # flt_flags = helper_funcs.filter_items_by_name(self.filter_name, self.bitflag_filter_item, collec, "name",
-            #                                               reverse=self.use_filter_sort_reverse)#self.use_filter_name_reverse)
-
-            ## Case insensitive, also search in both name and modulename
-            flt_flags = [self.bitflag_filter_item 
-                         if self.filter_name.lower() in item.name.lower() 
-                         or self.filter_name.lower() in item.addon_module.lower() 
-                         else 0 
-                         for item in collec]
+        filter_state = data.filter_state
+        filter_support = data.filter_support
+        if not self.filter_name and filter_state == 'ALL' and filter_support == 'ALL' and not self.sort_by_time:
+            return flt_flags, flt_neworder
+
+        ## Case sensitive 
+        # helper_funcs = bpy.types.UI_UL_list
+        # flt_flags = helper_funcs.filter_items_by_name(self.filter_name, self.bitflag_filter_item, collec, "name",
+        #                                               reverse=self.use_filter_sort_reverse)#self.use_filter_name_reverse)
+
+        ## Result is reused while filters, enabled addons and list content are unchanged
+        enabled = frozenset(a.module for a in context.preferences.addons) if filter_state != 'ALL' else None
+        signature = (filter_memo.generation, data.as_pointer(), len(collec), self.filter_name,
+                     filter_state, filter_support, enabled, self.sort_by_time)
+        if signature == filter_memo.signature:
+            return filter_memo.result
+
+        items = filter_memo.get_items(data, collec)
+        filter_name = self.filter_name.lower()
+        query = fuzzy_search.Query(self.filter_name) if filter_name else None
+        flt_flags = [0] * len(items)
+        ranked = []
+        for i, (name, module, name_key, module_key, support, time_total) in enumerate(items):
+            ## State and support filters
+            if filter_support != 'ALL' and support != filter_support:
+                continue
+            if filter_state == 'ACTIVE' and module not in enabled:
+                continue
+            if filter_state == 'INACTIVE' and module in enabled:
+                continue
+
+            if query:
+                ## ranked: prefix > word boundary > substring > fuzzy, in both name and modulename
+                score = max(fuzzy_search.score(query, name_key), fuzzy_search.score(query, module_key))
+                if not score and (filter_name in name.lower() or filter_name in module.lower()):
+                    score = 70.0 # case insensitive substring not matching normalized keys (ex: punctuation)
+                if score < fuzzy_search.MIN_SCORE:
+                    continue
+                ranked.append((-score, i))
+            elif self.sort_by_time:
+                ranked.append((0, i))
+
+            flt_flags[i] = self.bitflag_filter_item
+
+        if self.sort_by_time:
+            ## slowest addons on top (not profiled at the end)
+            ranked = [(-items[i][5], i) for _s, i in ranked]
+
+        if ranked:
+            ## best matches on top, filtered out items keep their order after
+            ranked.sort()
+            order = [i for _s, i in ranked]
+            order += [i for i, flag in enumerate(flt_flags) if not flag]
+            flt_neworder = [0] * len(items)
+            for new_index, i in enumerate(order):
+                flt_neworder[i] = new_index
+
+        filter_memo.signature = signature
+        filter_memo.result = (flt_flags, flt_neworder)
         return flt_flags, flt_neworder
 
 #--- PROPERTIES
@@ -212,6 +346,13 @@ class DEV_PG_addon_prop(PropertyGroup):
     addon_version : StringProperty() # version number
     select : BoolProperty(default=False)
 
+    ## enable profile (seconds, 0 if not profiled)
+    time_import : FloatProperty(name='Import Time', precision=4)
+    time_register : FloatProperty(name='Register Time', precision=4)
+    time_keymap : FloatProperty(name='Keymap Refresh Time', precision=4)
+    time_total : FloatProperty(name='Enable Time', precision=4)
+    profile_error : StringProperty()
+
 # def do_something(self, context):
 #     pl_prop = context.scene.devpack_props
 #     blend_uil = pl_prop.addon_list
@@ -230,8 +371,7 @@ class DEV_PG_addon_list_props(PropertyGroup):
             ('COMMUNITY', 'Community', 'Community addons'),
             ('TESTING', 'Testing', 'Testing support addons'),
         ),
-        update=reload_addon_list,
-    )
+    ) # filters are applied in UI list, no reload needed
     
     filter_state : EnumProperty(name='State Filter',
         default='ALL',
@@ -240,7 +380,6 @@ class DEV_PG_addon_list_props(PropertyGroup):
             ('ACTIVE', 'Active', 'Only enabled addons'),
             ('INACTIVE', 'Inactive', 'Only disabled addons'),
         ),
-        update=reload_addon_list,
     ) # Or use export helper
     # Other props
     
@@ -291,8 +430,11 @@ class DEV_PT_addon_list_ui(Panel):
             op.use_folder = True
 
             subcol.operator("dev.open_addon_prefs", icon="PREFERENCES", text="") # Open Active Prefs
+            subcol.operator("dev.show_import_tree", icon="OUTLINER", text="").module = ad.addon_module # Imports timing
 
-        col.label(text=f'{len([a for a in pl_prop.addon_list if a.select])}/{len(pl_prop.addon_list)} Selected')
+        if not len(pl_prop.addon_list):
+            col.label(text='Click refresh to load addons', icon='INFO')
+        col.label(text=f'{len(get_marked_addons(context))}/{len(pl_prop.addon_list)} Selected')
 
         # col.operator("dev.export_addon_zip_pack", icon="FILE_ARCHIVE", text="Export Addon Pack As Zip")
         subcol = col.column(align=True)
@@ -300,6 +442,18 @@ class DEV_PT_addon_list_ui(Panel):
         subcol.operator("dev.export_addon_zip_pack", icon="FILE_ARCHIVE", text="Export Individual Zips").pack = False
 
         layout.operator("dev.print_addon_list", icon="CONSOLE", text="Print Selected Infos")
+
+        row = layout.row(align=True)
+        row.operator("dev.profile_marked_addons", icon="TIME", text="Profile Enable Time")
+        row.operator("dev.export_addon_profile_csv", icon="EXPORT", text="")
+
+        from .addon_watcher import watched
+        row = layout.row(align=True)
+        if watched:
+            row.operator("dev.stop_addon_watch", icon="PAUSE", text=f"Stop Watching ({len(watched)})")
+            row.operator("dev.watch_marked_addons", icon="ADD", text="")
+        else:
+            row.operator("dev.watch_marked_addons", icon="FILE_REFRESH", text="Hot Reload Marked Addons")
         
         ## problem with batch enable. internal targeted addons __name__ variable seem to be wrong when enabling from here
         col = layout.column(align=True)
@@ -316,10 +470,7 @@ class DEV_OT_print_addon_list(Operator):
 
     def execute(self, context):
         print('\nSelected addons:')
-        pl_prop = context.scene.devpack_props.addon_list
-        for ad in pl_prop:
-            if not ad.select:
-                continue
+        for ad in get_marked_addons(context):
             print(ad.name)
             print(ad.addon_version)
             print(ad.addon_module)
@@ -328,56 +479,6 @@ class DEV_OT_print_addon_list(Operator):
             print()
         return {"FINISHED"}
 
-def get_addon_version(filepath):
-    """Get addon version from file or folder
-    Args:
-        filepath (Path): Path to addon file or folder
-    Returns:
-        str: version suffix formatted as '-v1_0_0' or empty string if not found
-    """
-    
-    init_version_pattern = r'"version":\s?\((\s?\d+\s?,\s?\d+\s?,\s?\d+\s?)\),'
-    if filepath.is_file():
-        # For single file, search version inside
-        with open(str(filepath), 'r') as fd:
-            text = fd.read()
-        res = re.search(init_version_pattern, text)
-        if res:
-            v = res.group(1)
-            return f'-v{v.replace(",", "_").replace(" ", "")}'
-    else:
-        # For folder, check manifest first then init
-        manifest = filepath / 'blender_manifest.toml'
-        if manifest.exists():
-            with open(str(manifest), 'r') as fd:
-                text = fd.read()
-            res = re.search(r'\bversion\s?=\s?\"(.*?)\"', text)
-            if res:
-                v = res.group(1)
-                return f'-v{v.replace(".", "_").replace(" ", "")}'
-        else:
-            init_file = filepath / '__init__.py'
-            if init_file.exists():
-                with open(str(init_file), 'r') as fd:
-                    text = fd.read()
-                res = re.search(init_version_pattern, text)
-                if res:
-                    v = res.group(1)
-                    return f'-v{v.replace(",", "_").replace(" ", "")}'
-    return ''
-
-## gitignore - Unused for now.
-def get_gitignore_patterns(gitignore_path):
-    """Get exclusion patterns from .gitignore translated to regex"""
-    if not gitignore_path.exists():
-        return []
-    
-    with open(gitignore_path, 'r') as f:
-        patterns = [line.strip() for line in f.readlines() 
-                   if line.strip() and not line.startswith('#')]
-    
-    return r'|'.join([fnmatch.translate(x) for x in patterns])
-
 class DEV_OT_export_addon_zip_pack(Operator, ExportHelper):
     bl_idname = "dev.export_addon_zip_pack"
     bl_label = "Export As Zip Pack"
@@ -417,8 +518,8 @@ class DEV_OT_export_addon_zip_pack(Operator, ExportHelper):
 
     respect_gitignore : BoolProperty(
         name="Respect .gitignore", 
-        description="Respect .gitignore exclusion patterns (only for files, not folder)\
-            \n(Does not work for single pack, only individual zips)",
+        description="Respect .gitignore at root of addon folders\
+            \nIgnored folders are not traversed (supports folder rules, anchors, ** and ! negation)",
         default=True)
 
     include_filter : StringProperty(
@@ -434,6 +535,32 @@ class DEV_OT_export_addon_zip_pack(Operator, ExportHelper):
         description='Choose if zip is made in compress mode or store mode',
         default=True)
 
+    compression_method : EnumProperty(
+        name='Compression',
+        default='DEFLATE',
+        items=(
+            ('DEFLATE', 'Deflate', 'Standard zip compression, fast'),
+            ('LZMA', 'LZMA', 'Smaller zips, slower to compress and extract'),
+        ),
+        description='Compression method used for files that are compressed')
+
+    compression_level : IntProperty(
+        name='Level',
+        default=6, min=1, max=9,
+        description='Deflate compression level or LZMA preset (1 fastest, 9 smallest)\
+            \nFiles bigger than 64 MB are streamed with default LZMA preset')
+
+    store_incompressible : BoolProperty(
+        name='Store Incompressible',
+        description='Store without compression already compressed files (images, archives, wheels, audio, video...)\
+            \nand files whose content sample looks random (ex: compressed .blend)',
+        default=True)
+
+    store_size_limit : IntProperty(
+        name='Store Above (MB)',
+        default=0, min=0,
+        description='Store files bigger than this size without compression (0 = no limit)')
+
     ## Option to zip as separate standalone zips
     pack : BoolProperty(
         name='Pack',
@@ -446,6 +573,17 @@ class DEV_OT_export_addon_zip_pack(Operator, ExportHelper):
         description="Add addon version number as suffix of zip name",
         default=True)
 
+    incremental : BoolProperty(
+        name="Incremental",
+        description="Copy unchanged files from previous zip at same path instead of compressing them again\
+            \nA manifest file (.zip.manifest.json) is written next to each zip to detect changes",
+        default=True)
+
+    concurrent : BoolProperty(
+        name="Concurrent",
+        description="Build individual zips in parallel threads (faster with many addons)",
+        default=True)
+
     def invoke(self, context, event):
         if self.pack:
             self.filepath = f'//addon_pack-{time.strftime("%Y_%m_%d")}.zip' # with date: 2022_01_28
@@ -463,18 +601,24 @@ class DEV_OT_export_addon_zip_pack(Operator, ExportHelper):
         layout.prop(self, 'exclude_git_files')
         layout.prop(self, 'exclude_filter')
         layout.prop(self, 'include_filter')
-        row = layout.row()
-        row.prop(self, 'respect_gitignore')
-        row.enabled = not self.pack
+        layout.prop(self, 'respect_gitignore')
         
         layout.separator()
         
         layout.label(text="Export Options:")
         layout.prop(self, 'compressed')
+        col = layout.column()
+        col.prop(self, 'compression_method')
+        col.prop(self, 'compression_level')
+        col.prop(self, 'store_incompressible')
+        col.prop(self, 'store_size_limit')
+        col.enabled = self.compressed
+        layout.prop(self, 'incremental')
         layout.prop(self, 'pack')
-        row = layout.row()
-        row.prop(self, 'add_version_in_name')
-        row.enabled = not self.pack
+        col = layout.column()
+        col.prop(self, 'add_version_in_name')
+        col.prop(self, 'concurrent')
+        col.enabled = not self.pack
 
         ## information for the user
         box = layout.box()
@@ -500,18 +644,15 @@ class DEV_OT_export_addon_zip_pack(Operator, ExportHelper):
 
     def execute(self, context):
         prefs = fn.get_addon_prefs()
-        pl_prop = context.scene.devpack_props
-        ad_list = pl_prop.addon_list
         # pathes = [Path(ad.addon_path) for ad in ad_list if ad.select]
         pathes = []
         print('Packing')
-        for ad in ad_list:
-            if ad.select:
-                if ad.addon_path.endswith('__init__.py'):
-                    pathes.append(Path(ad.addon_path).parent)
-                else:
-                    pathes.append(Path(ad.addon_path))
-                print(f'- {ad.name} ({ad.addon_module})')
+        for ad in get_marked_addons(context):
+            if ad.addon_path.endswith('__init__.py'):
+                pathes.append(Path(ad.addon_path).parent)
+            else:
+                pathes.append(Path(ad.addon_path))
+            print(f'- {ad.name} ({ad.addon_module})')
 
         ## pathes to addon.py for single file and __init__.py on mutilfile
         if not pathes:
@@ -543,53 +684,34 @@ class DEV_OT_export_addon_zip_pack(Operator, ExportHelper):
 
         arc_root_dir =  'addons/'
         
-        compress_type = zipfile.ZIP_DEFLATED if self.compressed else zipfile.ZIP_STORED
+        if not self.compressed:
+            policy = addon_zip.CompressionPolicy(zipfile.ZIP_STORED)
+        else:
+            method = zipfile.ZIP_LZMA if self.compression_method == 'LZMA' else zipfile.ZIP_DEFLATED
+            policy = addon_zip.CompressionPolicy(method, level=self.compression_level,
+                store_incompressible=self.store_incompressible,
+                max_size=self.store_size_limit * 1048576)
 
         if self.pack:
             ## Ensure zip pack has a name
             dest_zip = self.filepath
             if not self.filepath.endswith(('\\','/')):
                 dest_zip = str(Path(self.filepath) / f'addon_pack-{time.strftime("%Y_%m_%d")}.zip')
-            with zipfile.ZipFile(dest_zip, 'w',compress_type) as zipObj:        
-                for fp in pathes:
-                    if not fp.exists():
-                        print(f'Not exists: {fp.name}')
-                        continue
-                    
-                    if fp.is_file():
-                        arcname = arc_root_dir + fp.name
-                        print(f'adding: {arcname}')
-                        zipObj.write(str(fp), arcname)
-                    
-                    else: # Zip addon structure
-                        start = fp.parent.as_posix()
-                        for root, dirs, files in os.walk(str(fp)):
-                            # exclude dirs
-                            if excludes:
-                                dirs[:] = [d for d in dirs if not re.match(excludes, d)]
-                            # exclude/include files
-                            if excludes:
-                                files = [f for f in files if not re.match(excludes, f)]
-                            if includes:
-                                files = [f for f in files if re.match(includes, f)]
-
-                            for fname in files:
-                                full_path = Path(root) / fname
-                                # remove head start in path
-                                arcname = full_path.as_posix().replace(start, '').lstrip('/')
-                                arcname = arc_root_dir + arcname
-                                # if not '.git/' in arcname and not '__pycache__' in arcname :
-                                #     # don't print all git and cache stuff
-                                #     print(f'adding: {arcname}')
-                                print(f'adding: {arcname}')
-                                zipObj.write(str(full_path), arcname)
-                    print()
-            self.report({'INFO'}, f'Zip saved at: {dest_zip}')
+            sources = []
+            for fp in pathes:
+                if not fp.exists():
+                    print(f'Not exists: {fp.name}')
+                    continue
+                sources.append((fp, arc_root_dir))
+            ## single archive, members are compressed in parallel and written in listed order
+            archives = [(Path(dest_zip), sources)]
+            self.dest = dest_zip
         else:
             ## Ensure to unzip at currently viewed folder
             dest_folder = Path(self.filepath) if self.filepath.endswith(('\\','/')) else Path(self.filepath).parent
 
             # Individual zip files
+            archives = []
             for fp in pathes:
                 if not fp.exists():
                     print(f'Not exists: {fp.name}')
@@ -602,46 +724,123 @@ class DEV_OT_export_addon_zip_pack(Operator, ExportHelper):
                 version_suffix = ''
                 if self.add_version_in_name:
                     ## Version retrieval (empty string if not found)
-                    version_suffix = get_addon_version(fp)
-
-                zip_path = dest_folder / f"{addon_name}{version_suffix}.zip"
-                print(f'zipping {addon_name} in {dest_folder}:')
-                with zipfile.ZipFile(zip_path, 'w', compress_type) as zipObj:
-                    if fp.is_file():
-                        print(f'adding: {fp.name}')
-                        zipObj.write(str(fp), fp.name)
-                    else:
-                        ## add gitignore local exclusion
-                        local_excludes = []
-                        if self.respect_gitignore:
-                            if (gitignore_path := fp / '.gitignore').exists():
-                                print(f'Use gitignore excludes: {gitignore_path}')
-                                local_excludes = get_gitignore_patterns(gitignore_path)
-
-                        start = fp.parent.as_posix()
-                        for root, dirs, files in os.walk(str(fp)):
-                            if excludes:
-                                dirs[:] = [d for d in dirs if not re.match(excludes, d)]
-                            if excludes:
-                                files = [f for f in files if not re.match(excludes, f)]
-                            if includes:
-                                files = [f for f in files if re.match(includes, f)]
-
-                            if local_excludes:
-                                # local excludes from gitignore (does not exclude folder)
-                                files = [f for f in files if not re.match(local_excludes, f)]
-
-                            for fname in files:
-                                full_path = Path(root) / fname
-                                arcname = full_path.as_posix().replace(start, '').lstrip('/')
-                                print(f'adding: {arcname}')
-                                zipObj.write(str(full_path), arcname)
-                print(f'Created: {zip_path}\n')
-            self.report({'INFO'}, f'Zip saved at: {dest_folder}')
-        
+                    version_suffix = addon_zip.get_addon_version(fp)
+
+                archives.append((dest_folder / f"{addon_name}{version_suffix}.zip", [(fp, '')]))
+            self.dest = str(dest_folder)
+
+        if not archives:
+            self.report({'ERROR'}, 'Nothing to zip')
+            return {"CANCELLED"}
+
+        ## Listing and compression run on a worker thread, progress is shown in status bar
+        self.job = addon_zip.ZipExportJob(archives,
+            policy=policy,
+            excludes=excludes,
+            includes=includes,
+            respect_gitignore=self.respect_gitignore,
+            incremental=self.incremental,
+            concurrent=self.concurrent)
+        self.job.start()
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.2, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def stop_modal(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+
+    def modal(self, context, event):
+        job = self.job
+        if event.type == 'ESC' and event.value == 'PRESS':
+            ## worker stops at next file and removes unfinished archives
+            job.cancel()
+            return {'RUNNING_MODAL'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if not job.done:
+            if job.cancelled:
+                progress = 'cancelling...'
+            elif job.scanning:
+                progress = f'listing files: {job.files_total}'
+            else:
+                eta = job.eta()
+                progress = (f'{job.files_done}/{job.files_total} files, '
+                            f'{job.bytes_done / 1048576:.1f}/{job.bytes_total / 1048576:.1f} MB')
+                if eta >= 0:
+                    progress += f', ETA {eta:.0f}s'
+            context.workspace.status_text_set(f'Zip export: {progress} (Esc to cancel)')
+            return {'PASS_THROUGH'}
+
+        self.stop_modal(context)
+        return self.finish(job)
+
+    def finish(self, job):
+        '''Print export summary and report'''
+        print(f'\nZip export ({len(job.results)}/{len(job.archives)} archives, {job.elapsed:.2f}s):')
+        errors = []
+        total = addon_zip.ZipStats()
+        for res in job.results:
+            if res.error:
+                errors.append(res)
+                print(f'  ERROR {res.zip_path.name}: {res.error}')
+                continue
+            total.merge(res.stats)
+            print(f'  {res.duration:6.2f}s  {res.files:5d} files ({res.stats.reused} unchanged)  {res.size / 1024:9.1f} KB  {res.zip_path}')
+        print(f'Total: {job.files_done} files, {job.bytes_done / 1048576:.1f} MB')
+        print(total.summary() + '\n')
+
+        if job.cancelled:
+            self.report({'WARNING'}, f'Zip export cancelled, {len(job.results)} zips completed')
+            return {"CANCELLED"}
+        if job.error:
+            self.report({'ERROR'}, f'Zip export failed: {job.error}')
+            return {"CANCELLED"}
+        if errors:
+            self.report({'ERROR'}, f'{len(errors)}/{len(job.results)} zips failed, see console')
+            return {"CANCELLED"}
+        self.report({'INFO'}, f'Zip saved at: {self.dest} ({job.elapsed:.2f}s)')
         return {"FINISHED"}
 
 
+def toggle_addons(modules, enable=True, context=None) -> list:
+    '''Enable or disable addons through addon_utils, UI and keyconfigs are refreshed once at the end
+    Return list of (module, seconds, error message) in given order, a failure does not stop the batch
+    '''
+    context = context or bpy.context
+    results = []
+    enabled = {a.module for a in context.preferences.addons}
+    for module in modules:
+        if (module in enabled) == enable:
+            continue # already in requested state
+        if module == __package__ and not enable:
+            results.append((module, 0.0, 'devtools cannot disable itself from its own operator'))
+            continue
+        errors = []
+        start = time.perf_counter()
+        try:
+            if enable:
+                addon_utils.enable(module, default_set=True, handle_error=lambda ex: errors.append(str(ex)))
+            else:
+                addon_utils.disable(module, default_set=True, handle_error=lambda ex: errors.append(str(ex)))
+        except Exception as e:
+            errors.append(str(e))
+        results.append((module, time.perf_counter() - start, '; '.join(errors)))
+
+    if results:
+        invalidate_addon_enum_cache()
+        ## single refresh for the whole batch
+        context.window_manager.keyconfigs.update()
+        context.preferences.is_dirty = True
+        for window in context.window_manager.windows:
+            for area in window.screen.areas:
+                area.tag_redraw()
+    return results
+
 class DEV_OT_toggle_marked_addons(Operator):
     bl_idname = "dev.toggle_marked_addons"
     bl_label = "Enable Addons"
@@ -650,11 +849,34 @@ class DEV_OT_toggle_marked_addons(Operator):
 
     enable : BoolProperty(options={'SKIP_SAVE'})
 
+    batched : BoolProperty(name='Batched', default=True,
+    description='Toggle addons directly with addon_utils and refresh keymaps and UI once at the end\
+        \nElse use preferences operator for each addon (slower)')
+
     def execute(self, context):
-        pl_prop = context.scene.devpack_props.addon_list
-        for ad in pl_prop:
-            if not ad.select:
-                continue
+        marked = get_marked_addons(context)
+        if self.batched:
+            names = {ad.addon_module: ad.name for ad in marked}
+            start = time.perf_counter()
+            results = toggle_addons([ad.addon_module for ad in marked], enable=self.enable, context=context)
+            total = time.perf_counter() - start
+
+            state = 'Enable' if self.enable else 'Disable'
+            print(f'\n{state} {len(results)} addons ({len(marked) - len(results)} already {state.lower()}d):')
+            failed = []
+            for module, duration, error in results:
+                print(f'{duration * 1000:8.1f}ms  {names[module]} -> {module}{"  ERROR: " + error if error else ""}')
+                if error:
+                    failed.append(names[module])
+            print(f'Total: {total:.2f}s')
+
+            if failed:
+                self.report({'ERROR'}, f'{len(failed)}/{len(results)} failed: {", ".join(failed)} (see console)')
+            else:
+                self.report({'INFO'}, f'{state}d {len(results)} addons in {total:.2f}s')
+            return {"FINISHED"}
+
+        for ad in marked:
             if self.enable:
                 print(f'Enabling {ad.name} -> {ad.addon_module}')
                 bpy.ops.preferences.addon_enable(module=ad.addon_module)
@@ -665,6 +887,7 @@ class DEV_OT_toggle_marked_addons(Operator):
                 bpy.ops.preferences.addon_disable(module=ad.addon_module)
                 # addon_utils.disable(ad.addon_module)
 
+        invalidate_addon_enum_cache()
         return {"FINISHED"}
 
 class DEV_OT_open_addon_prefs(Operator):
@@ -690,9 +913,21 @@ class DEV_OT_open_addon_prefs(Operator):
         return {'FINISHED'}
 
 
+## Enum items of addons search popup, also keeps python reference to the strings (see below)
+addon_enum_cache = {'signature': None, 'items': []}
+
+def invalidate_addon_enum_cache():
+    addon_enum_cache['signature'] = None
+
 def get_addon_list(self, context):
-    '''return (identifier, name, description) of enum content'''
-    return get_addons_modules_infos() # self.all_addons_l
+    '''return (identifier, name, description) of enum content
+    Items are rebuilt only when enabled addons change or cache is invalidated (list reload, batch toggle)
+    '''
+    signature = tuple(a.module for a in context.preferences.addons)
+    if signature != addon_enum_cache['signature']:
+        addon_enum_cache['items'] = get_addons_modules_infos() # self.all_addons_l
+        addon_enum_cache['signature'] = signature
+    return addon_enum_cache['items']
     # return [(i.path, basename(i.path), "") for i in self.blends]
 
 ## TODO : make open in editor from python command
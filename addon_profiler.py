@@ -0,0 +1,341 @@
+import bpy
+import sys
+import csv
+import time
+import importlib
+import threading
+import contextlib
+import addon_utils
+from typing import NamedTuple
+from bpy_extras.io_utils import ExportHelper
+from bpy.props import StringProperty, BoolProperty, FloatProperty
+from bpy.types import Operator
+
+from .addon_listing import filter_memo, get_marked_addons
+
+
+class ProfileResult(NamedTuple):
+    import_time: float
+    register_time: float
+    keymap_time: float # keyconfigs update after register (handlers set in register are counted in register_time)
+    total: float
+    error: str = ''
+
+
+class EnableTimer:
+    '''Time import and register() of an addon while addon_utils enables it
+    importlib._bootstrap._find_and_load is wrapped for the duration of the context,
+    so the import is seen whether addon_utils uses __import__ (Blender < 4.2) or importlib.import_module,
+    and register function of loaded module is wrapped until exit
+    '''
+
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.import_time = 0.0
+        self.register_time = 0.0
+        self.module = None
+        self._find_and_load = None
+        self._register = None
+
+    def __enter__(self):
+        self._find_and_load = importlib._bootstrap._find_and_load
+        find_and_load = self._find_and_load
+
+        def timed_find_and_load(name, *args, **kwargs):
+            if name != self.module_name:
+                return find_and_load(name, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                mod = find_and_load(name, *args, **kwargs)
+            finally:
+                self.import_time += time.perf_counter() - start
+            self.wrap_register(mod)
+            return mod
+
+        importlib._bootstrap._find_and_load = timed_find_and_load
+        return self
+
+    def wrap_register(self, mod):
+        register = getattr(mod, 'register', None)
+        if register is None or self._register is not None:
+            return
+        self.module = mod
+        self._register = register
+
+        def timed_register(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return register(*args, **kwargs)
+            finally:
+                self.register_time += time.perf_counter() - start
+
+        mod.register = timed_register
+
+    def __exit__(self, *args):
+        importlib._bootstrap._find_and_load = self._find_and_load
+        if self.module is not None:
+            self.module.register = self._register
+
+
+class ImportNode:
+    '''Module imported during a trace, times in seconds'''
+    __slots__ = ('name', 'self_time', 'cumulative', 'children')
+
+    def __init__(self, name):
+        self.name = name
+        self.self_time = 0.0
+        self.cumulative = 0.0
+        self.children = []
+
+
+class ImportTracer:
+    '''Record a tree of modules loaded during the context, like python -X importtime
+    importlib._bootstrap._find_and_load (called for modules not yet in sys.modules) is wrapped,
+    only imports from the thread that entered the context are recorded
+    '''
+
+    def __init__(self, name='root'):
+        self.root = ImportNode(name)
+        self._stack = []
+        self._find_and_load = None
+        self._thread_id = None
+        self._start = 0.0
+
+    def __enter__(self):
+        self._stack = [self.root]
+        self._thread_id = threading.get_ident()
+        self._find_and_load = importlib._bootstrap._find_and_load
+        find_and_load = self._find_and_load
+
+        def traced_find_and_load(name, *args, **kwargs):
+            if threading.get_ident() != self._thread_id:
+                return find_and_load(name, *args, **kwargs)
+            node = ImportNode(name)
+            self._stack[-1].children.append(node)
+            self._stack.append(node)
+            start = time.perf_counter()
+            try:
+                return find_and_load(name, *args, **kwargs)
+            finally:
+                node.cumulative = time.perf_counter() - start
+                node.self_time = node.cumulative - sum(c.cumulative for c in node.children)
+                self._stack.pop()
+
+        importlib._bootstrap._find_and_load = traced_find_and_load
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        importlib._bootstrap._find_and_load = self._find_and_load
+        self.root.cumulative = time.perf_counter() - self._start
+        self.root.self_time = self.root.cumulative - sum(c.cumulative for c in self.root.children)
+
+
+## Import trees of traced addons by module name, kept for the session
+import_trees = {}
+
+def purge_modules(module_name):
+    '''Remove module and its submodules from sys.modules so next enable imports from scratch'''
+    for name in [n for n in sys.modules if n == module_name or n.startswith(f'{module_name}.')]:
+        del sys.modules[name]
+
+def profile_addon(module_name, context, trace_imports=False) -> ProfileResult:
+    '''Disable addon, purge its modules and enable it again with timings
+    Addon is disabled again after profiling if it was not enabled before
+    trace_imports: store tree of modules imported during enable in import_trees
+    '''
+    was_enabled = module_name in {a.module for a in context.preferences.addons}
+    if was_enabled:
+        addon_utils.disable(module_name, default_set=True)
+    purge_modules(module_name)
+
+    errors = []
+    start = time.perf_counter()
+    tracer = ImportTracer(module_name) if trace_imports else contextlib.nullcontext()
+    with EnableTimer(module_name) as enable_timer, tracer:
+        addon_utils.enable(module_name, default_set=True, handle_error=lambda ex: errors.append(str(ex)))
+    enable_time = time.perf_counter() - start
+    if trace_imports:
+        import_trees[module_name] = tracer.root
+
+    ## keymaps added by register are refreshed (as preferences addon toggle does)
+    start = time.perf_counter()
+    context.window_manager.keyconfigs.update()
+    keymap_time = time.perf_counter() - start
+
+    if not was_enabled:
+        addon_utils.disable(module_name, default_set=True)
+
+    import_time = enable_timer.import_time
+    if not import_time and not errors:
+        ## import not seen by the wrapper (other import path), count it as everything but register
+        import_time = enable_time - enable_timer.register_time
+    return ProfileResult(import_time, enable_timer.register_time, keymap_time,
+                         enable_time + keymap_time, '; '.join(errors))
+
+
+class DEV_OT_profile_marked_addons(Operator):
+    bl_idname = "dev.profile_marked_addons"
+    bl_label = "Profile Enable Time"
+    bl_description = "Disable then enable again each marked addon, recording import, register and keymap refresh times\
+        \nModules of profiled addons are reloaded from disk, initial enabled state is restored"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    trace_imports : BoolProperty(name='Trace Imports', default=True,
+    description='Record imported modules tree with timings (see import tree from addon list)')
+
+    def execute(self, context):
+        marked = get_marked_addons(context)
+        if not marked:
+            self.report({'ERROR'}, 'No addon marked in list')
+            return {"CANCELLED"}
+
+        print(f'\nAddons enable profile ({len(marked)}):')
+        print(f'{"import":>9} {"register":>9} {"keymap ref":>9} {"total":>9}  addon')
+        failed = 0
+        for ad in marked:
+            if ad.addon_module == __package__:
+                print(f'Skip {ad.name}: cannot profile devtools from itself')
+                continue
+
+            res = profile_addon(ad.addon_module, context, trace_imports=self.trace_imports)
+            ad.time_import = res.import_time
+            ad.time_register = res.register_time
+            ad.time_keymap = res.keymap_time
+            ad.time_total = res.total
+            ad.profile_error = res.error
+            if res.error:
+                failed += 1
+            print(f'{res.import_time * 1000:7.1f}ms {res.register_time * 1000:7.1f}ms {res.keymap_time * 1000:7.1f}ms '
+                  f'{res.total * 1000:7.1f}ms  {ad.name}{" ERROR: " + res.error if res.error else ""}')
+
+        ## timings changed, sorted list must be computed again
+        filter_memo.invalidate()
+
+        if failed:
+            self.report({'WARNING'}, f'{failed} addons failed to enable, see console')
+        else:
+            self.report({'INFO'}, f'{len(marked)} addons profiled, see console')
+        return {"FINISHED"}
+
+
+class DEV_OT_export_addon_profile_csv(Operator, ExportHelper):
+    bl_idname = "dev.export_addon_profile_csv"
+    bl_label = "Export Profile CSV"
+    bl_description = "Export enable timings of profiled addons as CSV (slowest first)"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    filename_ext = '.csv'
+    filter_glob: StringProperty(default='*.csv', options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return any(ad.time_total for ad in context.scene.devpack_props.addon_list)
+
+    def invoke(self, context, event):
+        self.filepath = f'addons_profile-{time.strftime("%Y_%m_%d")}.csv'
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        profiled = [ad for ad in context.scene.devpack_props.addon_list if ad.time_total]
+        profiled.sort(key=lambda ad: ad.time_total, reverse=True)
+        try:
+            with open(self.filepath, 'w', newline='', encoding='utf-8') as fd:
+                writer = csv.writer(fd)
+                writer.writerow(['name', 'module', 'version', 'import_ms', 'register_ms', 'keymap_refresh_ms', 'total_ms', 'error', 'path'])
+                for ad in profiled:
+                    writer.writerow([ad.name, ad.addon_module, ad.addon_version,
+                                     f'{ad.time_import * 1000:.2f}', f'{ad.time_register * 1000:.2f}',
+                                     f'{ad.time_keymap * 1000:.2f}', f'{ad.time_total * 1000:.2f}',
+                                     ad.profile_error, ad.addon_path])
+        except OSError as e:
+            self.report({'ERROR'}, f'Could not write CSV: {e}')
+            return {"CANCELLED"}
+
+        self.report({'INFO'}, f'{len(profiled)} addons timings saved at: {self.filepath}')
+        return {"FINISHED"}
+
+
+def draw_import_node(layout, node, min_time, idx_path='0'):
+    '''Draw node children, with collapsible sub-panels when available (Blender 4.1+)'''
+    for i, child in enumerate(sorted(node.children, key=lambda n: n.cumulative, reverse=True)):
+        if child.cumulative < min_time:
+            continue
+        label = f'{child.cumulative * 1000:8.1f} ms  ({child.self_time * 1000:.1f} self)  {child.name}'
+        visible_children = [c for c in child.children if c.cumulative >= min_time]
+        if not visible_children:
+            layout.label(text=label, icon='DOT')
+            continue
+
+        child_path = f'{idx_path}_{i}'
+        if hasattr(layout, 'panel'):
+            header, body = layout.panel(f'dev_import_tree_{child_path}', default_closed=True)
+            header.label(text=label)
+            if body:
+                draw_import_node(body, child, min_time, child_path)
+        else:
+            layout.label(text=label, icon='DISCLOSURE_TRI_DOWN')
+            split = layout.split(factor=0.03)
+            split.label(text='')
+            draw_import_node(split.column(align=True), child, min_time, child_path)
+
+
+class DEV_OT_show_import_tree(Operator):
+    bl_idname = "dev.show_import_tree"
+    bl_label = "Import Tree"
+    bl_description = "Show modules imported when enabling addon with self and cumulative times\
+        \nAddon is profiled with import tracing if it was not traced yet"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    module : StringProperty(options={'SKIP_SAVE'})
+
+    min_ms : FloatProperty(name='Hide Below (ms)', default=1.0, min=0.0,
+    description='Hide modules whose cumulative import time is below this value')
+
+    def invoke(self, context, event):
+        if self.module not in import_trees:
+            if self.module == __package__:
+                self.report({'ERROR'}, 'Cannot profile devtools from itself')
+                return {"CANCELLED"}
+            res = profile_addon(self.module, context, trace_imports=True)
+            if res.error:
+                self.report({'WARNING'}, f'Enable error: {res.error}')
+        return context.window_manager.invoke_props_dialog(self, width=550)
+
+    def draw(self, context):
+        layout = self.layout
+        root = import_trees.get(self.module)
+        if root is None:
+            layout.label(text=f'No import trace for {self.module}', icon='INFO')
+            return
+
+        count = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            count += len(node.children)
+            stack.extend(node.children)
+
+        layout.label(text=f'{self.module}: {count} modules imported, {root.cumulative * 1000:.1f} ms during enable')
+        layout.prop(self, 'min_ms')
+        layout.separator()
+        draw_import_node(layout.column(align=True), root, self.min_ms / 1000)
+
+    def execute(self, context):
+        return {"FINISHED"}
+
+
+classes = (
+DEV_OT_profile_marked_addons,
+DEV_OT_export_addon_profile_csv,
+DEV_OT_show_import_tree,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
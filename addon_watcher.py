@@ -0,0 +1,156 @@
+import bpy
+import os
+import time
+import addon_utils
+from pathlib import Path
+from bpy.types import Operator
+
+from .addon_profiler import purge_modules
+from .addon_listing import invalidate_addon_enum_cache, get_marked_addons
+
+WATCH_INTERVAL = 1.0 # seconds between checks
+STATUS_DURATION = 4.0 # seconds reload message stays in status bar
+
+## module : {'name', 'root', 'snapshot'}
+watched = {}
+
+def snapshot_tree(root) -> dict:
+    '''Return {filepath: (mtime_ns, size)} of source files under root (file or folder)
+    Hidden folders and python caches are skipped'''
+    if os.path.isfile(root):
+        st = os.stat(root)
+        return {root: (st.st_mtime_ns, st.st_size)}
+
+    snapshot = {}
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            entries = os.scandir(folder)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.') and entry.name != '__pycache__':
+                        stack.append(entry.path)
+                elif not entry.name.endswith('.pyc'):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+def set_status(text):
+    '''Show text in status bar of all windows (None to clear)'''
+    for window in bpy.context.window_manager.windows:
+        window.workspace.status_text_set(text)
+
+def clear_status():
+    set_status(None)
+    return None # unregister timer
+
+def reload_addon(module) -> tuple:
+    '''Disable addon, remove its modules from sys.modules and enable it again
+    Return (seconds, error message)'''
+    errors = []
+    start = time.perf_counter()
+    addon_utils.disable(module, default_set=False, handle_error=lambda ex: errors.append(str(ex)))
+    purge_modules(module)
+    addon_utils.enable(module, default_set=False, handle_error=lambda ex: errors.append(str(ex)))
+    bpy.context.window_manager.keyconfigs.update()
+    return time.perf_counter() - start, '; '.join(errors)
+
+def watch_tick():
+    '''Timer: reload enabled watched addons whose source files changed'''
+    if not watched:
+        return None
+
+    enabled = {a.module for a in bpy.context.preferences.addons}
+    for module, infos in watched.items():
+        snapshot = snapshot_tree(infos['root'])
+        if snapshot == infos['snapshot']:
+            continue
+        changed = len(snapshot.keys() ^ infos['snapshot'].keys())
+        changed += sum(1 for fp, stamp in snapshot.items() if infos['snapshot'].get(fp, stamp) != stamp)
+        infos['snapshot'] = snapshot
+        if module not in enabled:
+            continue
+
+        duration, error = reload_addon(module)
+        invalidate_addon_enum_cache() # name or version may have changed
+        if error:
+            print(f'Hot reload {infos["name"]} failed: {error}')
+            set_status(f'Hot reload {infos["name"]} failed (see console)')
+        else:
+            print(f'Hot reload {infos["name"]}: {changed} changed files, {duration * 1000:.0f} ms')
+            set_status(f'Reloaded {infos["name"]} in {duration * 1000:.0f} ms')
+        if bpy.app.timers.is_registered(clear_status):
+            bpy.app.timers.unregister(clear_status)
+        bpy.app.timers.register(clear_status, first_interval=STATUS_DURATION)
+
+    return WATCH_INTERVAL
+
+def stop_watch():
+    watched.clear()
+    if bpy.app.timers.is_registered(watch_tick):
+        bpy.app.timers.unregister(watch_tick)
+
+
+class DEV_OT_watch_marked_addons(Operator):
+    bl_idname = "dev.watch_marked_addons"
+    bl_label = "Watch Marked Addons"
+    bl_description = "Reload marked addons when one of their files changes on disk (checked every second)\
+        \nOnly enabled addons are reloaded, their modules are purged from sys.modules before enabling"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    def execute(self, context):
+        marked = get_marked_addons(context)
+        if not marked:
+            self.report({'ERROR'}, 'No addon marked in list')
+            return {"CANCELLED"}
+
+        for ad in marked:
+            if ad.addon_module == __package__:
+                self.report({'WARNING'}, 'Devtools cannot hot reload itself, skipped')
+                continue
+            fp = Path(ad.addon_path)
+            root = str(fp.parent if fp.name == '__init__.py' else fp)
+            watched[ad.addon_module] = {'name': ad.name, 'root': root, 'snapshot': snapshot_tree(root)}
+
+        if watched and not bpy.app.timers.is_registered(watch_tick):
+            bpy.app.timers.register(watch_tick, first_interval=WATCH_INTERVAL, persistent=True)
+
+        files = sum(len(infos['snapshot']) for infos in watched.values())
+        self.report({'INFO'}, f'Watching {len(watched)} addons ({files} files)')
+        return {"FINISHED"}
+
+
+class DEV_OT_stop_addon_watch(Operator):
+    bl_idname = "dev.stop_addon_watch"
+    bl_label = "Stop Watching Addons"
+    bl_description = "Stop hot reload of watched addons"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    def execute(self, context):
+        stop_watch()
+        self.report({'INFO'}, 'Addon watch stopped')
+        return {"FINISHED"}
+
+
+classes = (
+DEV_OT_watch_marked_addons,
+DEV_OT_stop_addon_watch,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    stop_watch()
+    if bpy.app.timers.is_registered(clear_status):
+        bpy.app.timers.unregister(clear_status)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,689 @@
+'''Addon zip export helpers, used by addon list export operator
+No bpy dependency: archives can be built from worker threads
+'''
+import os
+import re
+import time
+import zipfile
+import zlib
+import lzma
+import json
+import struct
+import math
+import threading
+from hashlib import blake2b
+from collections import deque
+from pathlib import Path
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor, Future
+
+
+def get_addon_version(filepath):
+    """Get addon version from file or folder
+    Args:
+        filepath (Path): Path to addon file or folder
+    Returns:
+        str: version suffix formatted as '-v1_0_0' or empty string if not found
+    """
+
+    init_version_pattern = r'"version":\s?\((\s?\d+\s?,\s?\d+\s?,\s?\d+\s?)\),'
+    if filepath.is_file():
+        # For single file, search version inside
+        with open(str(filepath), 'r') as fd:
+            text = fd.read()
+        res = re.search(init_version_pattern, text)
+        if res:
+            v = res.group(1)
+            return f'-v{v.replace(",", "_").replace(" ", "")}'
+    else:
+        # For folder, check manifest first then init
+        manifest = filepath / 'blender_manifest.toml'
+        if manifest.exists():
+            with open(str(manifest), 'r') as fd:
+                text = fd.read()
+            res = re.search(r'\bversion\s?=\s?\"(.*?)\"', text)
+            if res:
+                v = res.group(1)
+                return f'-v{v.replace(".", "_").replace(" ", "")}'
+        else:
+            init_file = filepath / '__init__.py'
+            if init_file.exists():
+                with open(str(init_file), 'r') as fd:
+                    text = fd.read()
+                res = re.search(init_version_pattern, text)
+                if res:
+                    v = res.group(1)
+                    return f'-v{v.replace(",", "_").replace(" ", "")}'
+    return ''
+
+## gitignore
+
+def translate_gitignore_pattern(pattern) -> str:
+    '''Translate a gitignore glob (without negation and trailing slash) to a regex body
+    "*" and "?" do not match "/", "**" matches any number of directories
+    '''
+    res = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            res.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i) and i + 2 == n:
+            res.append('.*')
+            i += 2
+        elif c == '*':
+            res.append('[^/]*')
+            i += 1
+        elif c == '?':
+            res.append('[^/]')
+            i += 1
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                res.append(re.escape(c))
+                i += 1
+                continue
+            content = pattern[i + 1:end]
+            if content[0] in '!^':
+                content = '^' + content[1:]
+            res.append(f'[{content}]')
+            i = end + 1
+        elif c == '\\' and i + 1 < n:
+            res.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            res.append(re.escape(c))
+            i += 1
+    return ''.join(res)
+
+
+class GitIgnore:
+    '''Compiled rules of a .gitignore file, matched against paths relative to its folder
+    Supports directory rules (trailing "/"), anchors (leading or inner "/"), "**" and "!" negation
+    Last matching rule wins
+    '''
+
+    def __init__(self, lines=()):
+        self.rules = [] # (compiled regex, negate, dir_only)
+        for line in lines:
+            self.add(line)
+
+    @classmethod
+    def from_file(cls, gitignore_path):
+        with open(gitignore_path, 'r', encoding='utf-8', errors='replace') as fd:
+            return cls(fd.read().splitlines())
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def add(self, line):
+        line = line.rstrip('\n')
+        ## trailing spaces are ignored unless escaped
+        stripped = line.rstrip(' ')
+        if stripped.endswith('\\') and len(stripped) < len(line):
+            stripped += ' '
+        line = stripped
+        if not line or line.startswith('#'):
+            return
+
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith(('\\!', '\\#')):
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return
+
+        ## a slash at start or in the middle anchors pattern to gitignore folder
+        anchored = '/' in line
+        line = line.lstrip('/')
+        prefix = '' if anchored else '(?:.*/)?'
+        regex = re.compile(f'^{prefix}{translate_gitignore_pattern(line)}$')
+        self.rules.append((regex, negate, dir_only))
+
+    def match(self, relpath, is_dir=False) -> bool:
+        '''True if relative posix path is ignored (parent directories are not checked)'''
+        ignored = False
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if ignored == negate and regex.match(relpath):
+                ignored = not negate
+        return ignored
+
+def iter_addon_files(fp, excludes='', includes='', respect_gitignore=False):
+    '''Yield (full path, arcname) of files to zip for an addon file or folder
+    arcname is relative to addon parent folder (start with addon folder name)
+    excludes, includes: regex applied on dir and file names (includes on files only)
+    '''
+    if fp.is_file():
+        yield fp, fp.name
+        return
+
+    ## gitignore of addon folder, compiled once
+    gitignore = None
+    if respect_gitignore:
+        if (gitignore_path := fp / '.gitignore').exists():
+            gitignore = GitIgnore.from_file(gitignore_path)
+
+    start = fp.parent.as_posix()
+    base = fp.as_posix()
+    for root, dirs, files in os.walk(str(fp)):
+        # exclude dirs
+        if excludes:
+            dirs[:] = [d for d in dirs if not re.match(excludes, d)]
+        # exclude/include files
+        if excludes:
+            files = [f for f in files if not re.match(excludes, f)]
+        if includes:
+            files = [f for f in files if re.match(includes, f)]
+
+        if gitignore:
+            ## ignored directories are pruned, never traversed
+            rel_root = Path(root).as_posix()[len(base):].lstrip('/')
+            rel_root = f'{rel_root}/' if rel_root else ''
+            dirs[:] = [d for d in dirs if not gitignore.match(rel_root + d, is_dir=True)]
+            files = [f for f in files if not gitignore.match(rel_root + f)]
+
+        for fname in files:
+            full_path = Path(root) / fname
+            # remove head start in path
+            arcname = full_path.as_posix().replace(start, '').lstrip('/')
+            yield full_path, arcname
+
+
+class ZipResult(NamedTuple):
+    zip_path: Path
+    files: int
+    size: int # archive size in bytes
+    duration: float
+    stats: 'ZipStats' = None
+    error: str = ''
+
+
+## Compression policy
+
+## Already compressed formats, deflating them again saves almost nothing
+INCOMPRESSIBLE_EXTENSIONS = {
+    '.png', '.jpg', '.jpeg', '.webp', '.gif', '.jp2', '.avif', '.heic',
+    '.zip', '.whl', '.gz', '.tgz', '.bz2', '.xz', '.lzma', '.zst', '.7z', '.rar', '.npz', '.jar',
+    '.mp3', '.ogg', '.opus', '.flac', '.aac', '.m4a', '.mp4', '.mkv', '.mov', '.webm', '.avi',
+    '.woff', '.woff2', '.pdf', '.docx', '.xlsx', '.pptx', '.odt', '.ods',
+}
+ENTROPY_SAMPLE_SIZE = 16 * 1024
+ENTROPY_THRESHOLD = 7.5 # bits per byte, 8 is random data
+
+def sample_entropy(data) -> float:
+    '''Shannon entropy (bits per byte) of a data sample'''
+    if not data:
+        return 0.0
+    size = len(data)
+    entropy = 0.0
+    for i in range(256):
+        count = data.count(i)
+        if count:
+            p = count / size
+            entropy -= p * math.log2(p)
+    return entropy
+
+
+class LZMAPresetCompressor(zipfile.LZMACompressor):
+    '''zipfile LZMA compressor using a preset level (zipfile always uses the default preset)'''
+
+    def __init__(self, preset):
+        super().__init__()
+        self.preset = preset
+
+    def _init(self):
+        filters = [{'id': lzma.FILTER_LZMA1, 'preset': self.preset}]
+        props = lzma._encode_filter_properties(filters[0])
+        self._comp = lzma.LZMACompressor(lzma.FORMAT_RAW, filters=filters)
+        ## zip LZMA header: LZMA SDK version (9.4), properties size, properties
+        return struct.pack('<BBH', 9, 4, len(props)) + props
+
+def get_compressor(compress_type, level=None):
+    '''Return compressor object for compress type, None for stored members
+    Same as zipfile._get_compressor, with level used as preset for LZMA'''
+    if compress_type == zipfile.ZIP_LZMA and level is not None:
+        return LZMAPresetCompressor(level)
+    return zipfile._get_compressor(compress_type, level)
+
+
+class CompressionPolicy:
+    '''Choose compression method of each member
+    method: compression used for regular files (ZIP_STORED, ZIP_DEFLATED or ZIP_LZMA)
+    level: deflate level or LZMA preset (None for default)
+        files streamed by zipfile (bigger than LARGE_FILE_SIZE) always use default LZMA preset
+    store_incompressible: store known compressed formats and files failing entropy sample
+    max_size: files bigger than this (bytes) are stored without compression (0 = no limit)
+    '''
+
+    def __init__(self, method=zipfile.ZIP_DEFLATED, level=None, store_incompressible=True, max_size=0):
+        self.method = method
+        self.level = level if method != zipfile.ZIP_STORED else None
+        self.store_incompressible = store_incompressible and method != zipfile.ZIP_STORED
+        self.max_size = max_size
+
+    def settings(self) -> dict:
+        '''Settings stored in manifest, previous members are reused only with identical settings'''
+        return {'method': self.method, 'level': self.level,
+                'store_incompressible': self.store_incompressible, 'max_size': self.max_size}
+
+    def choose(self, arcname, size, data=None) -> tuple:
+        '''Return (compress_type, compresslevel, reason) for a member
+        reason is empty when policy method is used, data is optional start of file content
+        '''
+        if self.method == zipfile.ZIP_STORED:
+            return zipfile.ZIP_STORED, None, ''
+        if self.max_size and size > self.max_size:
+            return zipfile.ZIP_STORED, None, 'size'
+        if self.store_incompressible:
+            if os.path.splitext(arcname)[1].lower() in INCOMPRESSIBLE_EXTENSIONS:
+                return zipfile.ZIP_STORED, None, 'extension'
+            if data is not None and size > 1024 and sample_entropy(data[:ENTROPY_SAMPLE_SIZE]) > ENTROPY_THRESHOLD:
+                return zipfile.ZIP_STORED, None, 'entropy'
+        return self.method, self.level, ''
+
+
+class ZipStats:
+    '''Counters of an archive build'''
+
+    def __init__(self):
+        self.files = 0
+        self.reused = 0 # copied from previous archive
+        self.stored = {} # reason : count of members stored by policy
+        self.bytes_in = 0 # uncompressed size
+        self.bytes_out = 0 # compressed size
+        self.stored_bytes = 0 # size of members stored by policy
+        self.compressed_bytes = 0 # uncompressed size of compressed members
+        self.compress_time = 0.0 # time spent compressing (summed over threads)
+
+    def merge(self, other):
+        for key in ('files', 'reused', 'bytes_in', 'bytes_out', 'stored_bytes', 'compressed_bytes', 'compress_time'):
+            setattr(self, key, getattr(self, key) + getattr(other, key))
+        for reason, count in other.stored.items():
+            self.stored[reason] = self.stored.get(reason, 0) + count
+
+    def summary(self) -> str:
+        lines = []
+        saved = self.bytes_in - self.bytes_out
+        ratio = saved / self.bytes_in * 100 if self.bytes_in else 0
+        lines.append(f'Size: {self.bytes_in / 1048576:.2f} MB -> {self.bytes_out / 1048576:.2f} MB'
+                     f' (saved {saved / 1048576:.2f} MB, {ratio:.0f}%)')
+        lines.append(f'Compression time: {self.compress_time:.2f}s for {self.compressed_bytes / 1048576:.2f} MB')
+        if self.stored:
+            reasons = ', '.join(f'{count} by {reason}' for reason, count in self.stored.items())
+            line = f'Stored without compression: {sum(self.stored.values())} files, {self.stored_bytes / 1048576:.2f} MB ({reasons})'
+            if self.compressed_bytes >= 1048576 and self.compress_time:
+                ## estimated from measured compression throughput (not meaningful on tiny samples)
+                line += f', ~{self.stored_bytes * self.compress_time / self.compressed_bytes:.2f}s saved'
+            lines.append(line)
+        if self.reused:
+            lines.append(f'Unchanged files copied from previous zip: {self.reused}')
+        return '\n'.join(lines)
+
+
+## Parallel members compression
+
+LARGE_FILE_SIZE = 64 * 1024 * 1024 # bigger files are streamed by the writer (not loaded in memory)
+MAX_PENDING_BYTES = 256 * 1024 * 1024 # size of files read or compressed in memory, waiting to be written
+COMPRESS_OPTION_BITS = 0x06 # general purpose flag bits 1-2, compression options (ex: LZMA end-of-stream marker)
+CHUNK_SIZE = 1024 * 1024
+
+def file_digest(full_path) -> str:
+    '''Content hash of a file read by chunks'''
+    h = blake2b(digest_size=16)
+    with open(full_path, 'rb') as fd:
+        while chunk := fd.read(CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+def compress_member(full_path, arcname, policy, known_digest=''):
+    '''Read and compress a file, return (ZipInfo, compressed bytes, content hash, policy reason, seconds)
+    ready to be written
+    Compressed bytes are None when content hash equals known_digest (member can be copied from previous archive)
+    Thread safe: only the writer touches the archive
+    '''
+    zinfo = zipfile.ZipInfo.from_file(full_path, arcname, strict_timestamps=False)
+    with open(full_path, 'rb') as fd:
+        data = fd.read()
+    digest = blake2b(data, digest_size=16).hexdigest()
+    zinfo.file_size = len(data)
+    if digest == known_digest:
+        return zinfo, None, digest, '', 0.0
+
+    start = time.perf_counter()
+    compress_type, compresslevel, reason = policy.choose(arcname, len(data), data)
+    zinfo.compress_type = compress_type
+    if compress_type == zipfile.ZIP_LZMA:
+        ## compressed data ends with an end-of-stream marker (as set by zipfile)
+        zinfo.flag_bits |= zipfile._MASK_COMPRESS_OPTION_1
+    zinfo.CRC = zlib.crc32(data)
+    compressor = get_compressor(compress_type, compresslevel)
+    if compressor:
+        payload = compressor.compress(data) + compressor.flush()
+    else:
+        payload = data
+    zinfo.compress_size = len(payload)
+    return zinfo, payload, digest, reason, time.perf_counter() - start
+
+## Private ZipFile attributes used by write_precompressed (zipfile has no public API to add compressed bytes)
+ZIPFILE_INTERNALS = ('_writecheck', '_didModify', 'start_dir', 'fp', 'filelist', 'NameToInfo')
+
+def write_precompressed(zf, zinfo, payload):
+    '''Append an already compressed member to a ZipFile open in write mode
+    Sizes and CRC are known, so local header is final and no data descriptor is needed
+    Relies on ZipFile internals (same steps as ZipFile.writestr), checked so a python upgrade fails clearly
+    '''
+    missing = [attr for attr in ZIPFILE_INTERNALS if not hasattr(zf, attr)]
+    if missing:
+        raise RuntimeError(f'Unsupported zipfile version, missing ZipFile internals: {", ".join(missing)}')
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    zf.fp.write(zinfo.FileHeader(zip64))
+    zf.fp.write(payload)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
+
+def read_raw_member(zf, zinfo) -> bytes:
+    '''Return compressed bytes of a member of an archive open in read mode, without decompressing'''
+    zf.fp.seek(zinfo.header_offset)
+    header = zf.fp.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f'Bad local header for {zinfo.filename}')
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    zf.fp.seek(fields[zipfile._FH_FILENAME_LENGTH] + fields[zipfile._FH_EXTRA_FIELD_LENGTH], 1)
+    return zf.fp.read(zinfo.compress_size)
+
+def write_members(zf, members, policy, max_workers=None, callback=None,
+                  previous=None, old_zf=None, manifest=None) -> ZipStats:
+    '''Compress (full path, arcname) members on a thread pool and append them to open ZipFile
+    Members are written by a single writer in the given order (deterministic archive)
+    Total size of members pending in memory is bounded by MAX_PENDING_BYTES,
+    number of pending members is also bounded so progress callback is called regularly
+    policy: CompressionPolicy choosing compression of each member
+    callback(zinfo) is called after each written member
+
+    previous: manifest members of previous archive (old_zf, open in read mode),
+        unchanged members are copied raw from it instead of being compressed again
+    manifest: dict filled with written members infos (arcname : path, size, mtime, hash, offset)
+    '''
+    if max_workers is None:
+        max_workers = os.cpu_count() or 4
+    previous = previous or {}
+    stats = ZipStats()
+
+    def reusable(arcname):
+        '''Return previous archive member if still matching manifest'''
+        if old_zf is None or arcname not in previous:
+            return None
+        old_zinfo = old_zf.NameToInfo.get(arcname)
+        if old_zinfo is None or old_zinfo.header_offset != previous[arcname]['offset']:
+            return None
+        return old_zinfo
+
+    def write(full_path, st, zinfo, payload, digest, reason='', seconds=0.0):
+        prev_hash = previous.get(zinfo.filename, {}).get('hash')
+        if payload is None and digest == prev_hash and (old_zinfo := reusable(zinfo.filename)):
+            ## unchanged content, copy compressed bytes from previous archive
+            zinfo.compress_type = old_zinfo.compress_type
+            zinfo.flag_bits = (zinfo.flag_bits & ~COMPRESS_OPTION_BITS) | (old_zinfo.flag_bits & COMPRESS_OPTION_BITS)
+            zinfo.CRC = old_zinfo.CRC
+            zinfo.file_size = old_zinfo.file_size
+            zinfo.compress_size = old_zinfo.compress_size
+            write_precompressed(zf, zinfo, read_raw_member(old_zf, old_zinfo))
+            stats.reused += 1
+        elif payload is None:
+            ## large file, streamed by zipfile (policy decided on size and extension only)
+            compress_type, compresslevel, reason = policy.choose(zinfo.filename, st.st_size)
+            start = time.perf_counter()
+            zf.write(str(full_path), zinfo.filename, compress_type, compresslevel)
+            seconds = time.perf_counter() - start
+            zinfo = zf.filelist[-1]
+        else:
+            write_precompressed(zf, zinfo, payload)
+
+        stats.files += 1
+        stats.bytes_in += zinfo.file_size
+        stats.bytes_out += zinfo.compress_size
+        if reason:
+            stats.stored[reason] = stats.stored.get(reason, 0) + 1
+            stats.stored_bytes += zinfo.file_size
+        elif seconds and zinfo.compress_type != zipfile.ZIP_STORED:
+            stats.compressed_bytes += zinfo.file_size
+            stats.compress_time += seconds
+
+        if manifest is not None:
+            manifest[zinfo.filename] = {'path': str(full_path), 'size': st.st_size, 'mtime': st.st_mtime_ns,
+                                        'hash': digest, 'offset': zinfo.header_offset}
+        if callback:
+            callback(zinfo)
+
+    pending = deque()
+    pending_bytes = 0
+    max_count = max_workers * 4
+    def flush(max_bytes=-1, max_count=0):
+        '''Write pending members in order until pending size and count are at most max_bytes and max_count
+        (all by default)'''
+        nonlocal pending_bytes
+        while pending and (pending_bytes > max_bytes or len(pending) > max_count):
+            full_path, st, item, size = pending.popleft()
+            pending_bytes -= size
+            write(full_path, st, *(item.result() if isinstance(item, Future) else item))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for full_path, arcname in members:
+            st = os.stat(full_path)
+            prev = previous.get(arcname)
+            if (prev and prev['size'] == st.st_size and prev['mtime'] == st.st_mtime_ns
+                and reusable(arcname)):
+                ## same size and modification time, no need to read the file
+                zinfo = zipfile.ZipInfo.from_file(full_path, arcname, strict_timestamps=False)
+                pending.append((full_path, st, (zinfo, None, prev['hash']), 0))
+
+            elif st.st_size > LARGE_FILE_SIZE:
+                ## flush pending members to keep order, then stream
+                flush()
+                zinfo = zipfile.ZipInfo.from_file(full_path, arcname, strict_timestamps=False)
+                write(full_path, st, zinfo, None, file_digest(full_path))
+                continue
+
+            else:
+                ## file content and its compressed copy are held until written
+                flush(MAX_PENDING_BYTES - st.st_size, max_count)
+                known = prev['hash'] if prev else ''
+                future = pool.submit(compress_member, full_path, arcname, policy, known)
+                pending.append((full_path, st, future, st.st_size))
+                pending_bytes += st.st_size
+
+            flush(MAX_PENDING_BYTES, max_count)
+        flush()
+    return stats
+
+class ExportCancelled(Exception):
+    '''Raised from member callback to stop an archive build'''
+
+## Incremental archives
+
+MANIFEST_SUFFIX = '.manifest.json'
+MANIFEST_VERSION = 1
+
+def get_manifest_path(zip_path) -> Path:
+    '''Sidecar manifest describing members of an exported zip'''
+    return Path(f'{zip_path}{MANIFEST_SUFFIX}')
+
+def load_manifest(zip_path, policy) -> dict:
+    '''Return members of previous export manifest
+    Empty if missing, unreadable or made with other compression settings
+    '''
+    manifest_path = get_manifest_path(zip_path)
+    if not manifest_path.exists() or not Path(zip_path).exists():
+        return {}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as fd:
+            data = json.load(fd)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != MANIFEST_VERSION or data.get('compression') != policy.settings():
+        return {}
+    return data.get('members', {})
+
+def build_zip(zip_path, members, policy=None, incremental=True, max_workers=None, callback=None) -> ZipResult:
+    '''Write members to zip_path and a sidecar manifest next to it
+    Archive is written to a temporary file then moved over zip_path
+    policy: CompressionPolicy (default deflate, incompressible files stored)
+    incremental: copy unchanged members from previous archive at same path
+    Errors are returned in result (not raised), temporary file is removed
+    '''
+    start = time.perf_counter()
+    policy = policy or CompressionPolicy()
+    zip_path = Path(zip_path)
+    tmp_path = zip_path.with_name(zip_path.name + '.tmp')
+    previous = load_manifest(zip_path, policy) if incremental else {}
+    manifest = {}
+    stats = ZipStats()
+    old_zf = None
+    try:
+        if previous:
+            try:
+                old_zf = zipfile.ZipFile(zip_path, 'r')
+            except zipfile.BadZipFile:
+                previous = {}
+
+        with zipfile.ZipFile(tmp_path, 'w', policy.method, compresslevel=policy.level) as zf:
+            stats = write_members(zf, members, policy, max_workers=max_workers,
+                                  callback=callback, previous=previous, old_zf=old_zf, manifest=manifest)
+        if old_zf:
+            old_zf.close()
+            old_zf = None
+        os.replace(tmp_path, zip_path)
+
+        with open(get_manifest_path(zip_path), 'w', encoding='utf-8') as fd:
+            json.dump({'version': MANIFEST_VERSION, 'compression': policy.settings(),
+                       'members': manifest}, fd, indent=1)
+
+    except (OSError, zipfile.BadZipFile, ExportCancelled) as e:
+        if old_zf:
+            old_zf.close()
+        ## remove partial archive, previous one is left untouched
+        if tmp_path.exists():
+            tmp_path.unlink()
+        if isinstance(e, ExportCancelled):
+            raise
+        return ZipResult(zip_path, stats.files, 0, time.perf_counter() - start, stats, error=str(e))
+
+    return ZipResult(zip_path, stats.files, zip_path.stat().st_size, time.perf_counter() - start, stats)
+
+
+## Background export
+
+class ZipExportJob:
+    '''Zip export running on a worker thread
+    Files are listed then archives are built, progress counters are read from main thread
+    archives: list of (zip path, [(addon path, arcname prefix), ...])
+    policy: CompressionPolicy used for all archives
+    '''
+
+    def __init__(self, archives, policy=None, excludes='', includes='',
+                 respect_gitignore=True, incremental=True, concurrent=True):
+        self.archives = archives
+        self.policy = policy or CompressionPolicy()
+        self.excludes = excludes
+        self.includes = includes
+        self.respect_gitignore = respect_gitignore
+        self.incremental = incremental
+        self.concurrent = concurrent
+
+        self.scanning = True
+        self.files_total = 0
+        self.bytes_total = 0
+        self.files_done = 0
+        self.bytes_done = 0
+        self.results = [] # ZipResult in archives order
+        self.error = ''
+        self.start_time = 0.0
+        self.end_time = 0.0
+        self.cancel_event = threading.Event()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        self.thread = threading.Thread(target=self.run, name='addon_zip_export', daemon=True)
+        self.thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self.thread is not None and not self.thread.is_alive()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    def eta(self) -> float:
+        '''Estimated remaining seconds from processed bytes, -1 when unknown'''
+        if self.scanning or not self.bytes_done:
+            return -1.0
+        return self.elapsed * (self.bytes_total - self.bytes_done) / self.bytes_done
+
+    def on_member(self, zinfo):
+        with self.lock:
+            self.files_done += 1
+            self.bytes_done += zinfo.file_size
+        if self.cancelled:
+            raise ExportCancelled
+
+    def list_members(self, sources) -> list:
+        members = []
+        for fp, prefix in sources:
+            for full_path, arcname in iter_addon_files(fp, self.excludes, self.includes, self.respect_gitignore):
+                if self.cancelled:
+                    raise ExportCancelled
+                members.append((full_path, prefix + arcname))
+                self.files_total += 1
+                self.bytes_total += os.path.getsize(full_path)
+        return members
+
+    def build(self, zip_path, members, max_workers=None) -> ZipResult:
+        return build_zip(zip_path, members, self.policy, incremental=self.incremental,
+                         max_workers=max_workers, callback=self.on_member)
+
+    def run(self):
+        try:
+            listed = [(zip_path, self.list_members(sources)) for zip_path, sources in self.archives]
+            self.scanning = False
+
+            if self.concurrent and len(listed) > 1:
+                ## one archive per thread, members compressed by the archive thread
+                workers = min(len(listed), os.cpu_count() or 4)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(self.build, zip_path, members, 1) for zip_path, members in listed]
+                    for f in futures:
+                        try:
+                            self.results.append(f.result())
+                        except ExportCancelled:
+                            pass
+            else:
+                for zip_path, members in listed:
+                    self.results.append(self.build(zip_path, members))
+        except ExportCancelled:
+            pass
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self.end_time = time.perf_counter()
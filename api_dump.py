@@ -0,0 +1,95 @@
+'''Api tree dump as gzip compressed JSON Lines
+One record per explored element: {"path", "type", "value"} (+ "ref" for already visited elements)
+First line is a header record describing the dump.
+
+No bpy dependency: dumps can be searched and compared outside of Blender
+    python api_dump.py search dump.jsonl.gz frame_start
+    python api_dump.py diff before.jsonl.gz after.jsonl.gz
+'''
+import gzip
+import json
+import re
+import sys
+import time
+
+DUMP_FORMAT = 'devtools-api-dump'
+DUMP_VERSION = 1
+
+class DumpWriter:
+    '''Stream records to a gzip JSON Lines file, nothing is kept in memory'''
+
+    def __init__(self, filepath, root='', **infos):
+        self.filepath = str(filepath)
+        self.count = 0
+        self.fd = gzip.open(self.filepath, 'wt', encoding='utf-8', compresslevel=6)
+        header = {'format': DUMP_FORMAT, 'version': DUMP_VERSION, 'root': root,
+                  'date': time.strftime('%Y-%m-%d %H:%M:%S'), **infos}
+        self.fd.write(json.dumps(header) + '\n')
+
+    def write(self, path, type_name, value, ref=''):
+        record = {'path': path, 'type': type_name, 'value': value}
+        if ref:
+            record['ref'] = ref
+        self.fd.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.count += 1
+
+    def close(self):
+        if self.fd:
+            self.fd.close()
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def read_header(filepath) -> dict:
+    '''Return header record of a dump'''
+    with gzip.open(filepath, 'rt', encoding='utf-8') as fd:
+        return json.loads(fd.readline())
+
+def iter_records(filepath):
+    '''Yield element records of a dump (header excluded)'''
+    with gzip.open(filepath, 'rt', encoding='utf-8') as fd:
+        header = json.loads(fd.readline())
+        if header.get('format') != DUMP_FORMAT:
+            raise ValueError(f'Not an api dump: {filepath}')
+        for line in fd:
+            if line.strip():
+                yield json.loads(line)
+
+def search_dump(filepath, pattern, in_values=False):
+    '''Yield records whose path (or value) matches regex pattern (case insensitive)'''
+    regex = re.compile(pattern, re.IGNORECASE)
+    for record in iter_records(filepath):
+        if regex.search(record['path']) or (in_values and regex.search(str(record['value']))):
+            yield record
+
+def diff_dumps(old_filepath, new_filepath):
+    '''Yield (path, old value, new value) for changed, added (old is None) and removed (new is None) elements'''
+    old = {r['path']: r['value'] for r in iter_records(old_filepath)}
+    for record in iter_records(new_filepath):
+        path = record['path']
+        if path not in old:
+            yield path, None, record['value']
+            continue
+        old_value = old.pop(path)
+        if old_value != record['value']:
+            yield path, old_value, record['value']
+    for path, old_value in old.items():
+        yield path, old_value, None
+
+
+if __name__ == '__main__':
+    usage = 'usage:\n  api_dump.py search <dump> <regex> [--values]\n  api_dump.py diff <old_dump> <new_dump>'
+    args = sys.argv[1:]
+    if len(args) >= 3 and args[0] == 'search':
+        for r in search_dump(args[1], args[2], in_values='--values' in args):
+            print(f"{r['path']} : {r['value']}")
+    elif len(args) == 3 and args[0] == 'diff':
+        for path, old_value, new_value in diff_dumps(args[1], args[2]):
+            print(f'{path} : {old_value} -> {new_value}')
+    else:
+        print(usage)
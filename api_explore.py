@@ -1,19 +1,283 @@
 import bpy, mathutils
+import ast
+from pathlib import Path
+import time
+from collections import deque
+from itertools import islice
+from typing import NamedTuple
+from . import api_schema
+from . import fuzzy_search
+from . import api_dump
+from . import api_values
+from . import fn
 
 exclude = (
 ### add lines here to exclude specific attribute
 'bl_rna', 'identifier','name_property','rna_type','properties', 'id_data', 'id_library',#basic
 
-## To avoid recursion/crash on direct object call (comment for API check on deeper props)
-'data', 'edges', 'faces', 'edge_keys', 'polygons', 'loops', 'face_maps', 'original',
-
 ##  Avoid some specific properties
 'CustomShelf', 'context', 'libmv',
 #'matrix_local', 'matrix_parent_inverse', 'matrix_basis','location','rotation_euler', 'rotation_quaternion', 'rotation_axis_angle', 'scale', 'translation',
 )
 
+## To avoid recursion/crash on direct object call (comment for API check on deeper props)
+## Only used on unbounded exploration, budgeted exploration samples collections instead
+exclude_unbounded = (
+'data', 'edges', 'faces', 'edge_keys', 'polygons', 'loops', 'face_maps', 'original',
+)
+
 ## starting with 'id_' ?
 
+## Values written as is (not explored)
+leaf_types = {int, float, bool, str, bpy.types.bpy_prop_array,
+              mathutils.Vector, mathutils.Color, mathutils.Matrix, mathutils.Euler, mathutils.Quaternion}
+
+def array_values(array) -> tuple:
+    '''Return values of a bpy_prop_array as (nested) tuple, its repr is only the data path'''
+    return tuple(array_values(v) if type(v) is bpy.types.bpy_prop_array else v for v in array)
+
+## State of the last time-sliced search, displayed in results panel
+live_search = {
+    'running': False,
+    'cancel': False,
+    'data_path': '',
+    'search': '',
+    'checked': 0,
+    'found': [],
+    'status': '',
+}
+
+## Fuzzy indexes of explored attributes by (data path, exploration settings) : (index, time of exploration)
+## reused by following searches with same path and settings
+path_indexes = {}
+
+## Values written as is in dump files (others are written as repr)
+json_types = {int, float, bool, str}
+
+## Root names accepted in data paths
+root_names = {
+    'bpy': lambda: bpy,
+    'C': lambda: bpy.context,
+    'D': lambda: bpy.data,
+}
+
+def resolve_data_path(data_path):
+    '''Return the object pointed by a data path string without using eval
+    Only attributes and subscripts with literal keys are accepted
+    ex: bpy.context.scene.objects['Cube'].modifiers[0]
+    Raise ValueError on unsupported expression
+    '''
+    try:
+        node = ast.parse(data_path.strip(), mode='eval').body
+    except SyntaxError as e:
+        raise ValueError(f'Invalid data path: {data_path}') from e
+
+    ## Unroll expression from the end to the root name
+    chain = []
+    while not isinstance(node, ast.Name):
+        if isinstance(node, ast.Attribute):
+            chain.append(('attr', node.attr))
+            node = node.value
+        elif isinstance(node, ast.Subscript):
+            try:
+                key = ast.literal_eval(node.slice)
+            except ValueError as e:
+                raise ValueError(f'Only literal keys are supported in data path: {data_path}') from e
+            chain.append(('key', key))
+            node = node.value
+        else:
+            raise ValueError(f'Unsupported expression in data path: {data_path}')
+
+    if node.id not in root_names:
+        raise ValueError(f'Data path must start with one of {", ".join(root_names)}: {data_path}')
+
+    obj = root_names[node.id]()
+    for kind, key in reversed(chain):
+        obj = getattr(obj, key) if kind == 'attr' else obj[key]
+    return obj
+
+def get_identity(value, owner=None, attr=''):
+    '''Return a hashable key identifying the data behind a value
+    RNA structs are keyed by type and memory pointer,
+    collections by their owner pointer and attribute name.
+    None when value has no stable identity (python wrappers are recreated on each access)
+    '''
+    if isinstance(value, bpy.types.bpy_struct):
+        return (type(value), value.as_pointer())
+    if isinstance(value, bpy.types.bpy_prop_collection) and isinstance(owner, bpy.types.bpy_struct):
+        return (type(owner), owner.as_pointer(), attr)
+    return None
+
+def get_reference_path(value, path):
+    '''Path written when a visited element is met again
+    ID datablocks use their canonical path (ex: bpy.data.objects['Cube'])'''
+    if isinstance(value, bpy.types.ID):
+        return repr(value)
+    return path
+
+class ApiNode(NamedTuple):
+    '''Element met during traversal, path string is only built on demand'''
+    parent_path: str
+    attr: str # attribute name, or "[index]" for sampled collection items
+    value: object
+    depth: int
+    leaf: bool # scalar value, not explored
+    ref: str = '' # path of first visit when element was already explored
+    size: int = -1 # number of items for sampled collections
+
+    @property
+    def path(self):
+        if self.attr.startswith('['):
+            return f'{self.parent_path}{self.attr}'
+        return f'{self.parent_path}.{self.attr}'
+
+
+class ApiWalker:
+    '''Api traversal carrying resolved objects down the tree
+    Iterate to get ApiNode, depth-first in the same order as a recursive exploration,
+    or breadth-first so that budgets cut the deepest elements first.
+
+    root: object to explore (ex: result of resolve_data_path)
+    root_path: path string of root, used as prefix of nodes paths
+    skip_visited: explore each element once, next visits are yielded as reference nodes
+    breadth_first: explore level by level instead of depth-first
+    max_nodes: stop after yielding this number of nodes (0 = unlimited)
+    max_depth: do not explore elements deeper than this level (0 = unlimited)
+    sample_size: number of items explored in each collection, with a size summary
+        (0 = items are not explored and heavy attributes in exclude_unbounded are skipped)
+    prune: optional callable(owner, attr, value) returning True to skip exploration of value
+    '''
+
+    def __init__(self, root, root_path, skip_visited=True,
+                 breadth_first=False, max_nodes=0, max_depth=0, sample_size=0, prune=None):
+        self.root = root
+        self.root_path = root_path
+        self.skip_visited = skip_visited
+        self.breadth_first = breadth_first
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.sample_size = sample_size
+        self.prune = prune
+        self.exclude = set(exclude) if sample_size else set(exclude + exclude_unbounded)
+
+        self.visited = {} # identity key : first path met
+        self.checked = 0 # number of explored elements
+        self.looped = 0 # number of tested attributes
+        self.count = 0 # number of yielded nodes
+        self.truncated = False # a budget limit was reached
+
+        if skip_visited and (key := get_identity(root)) is not None:
+            self.visited[key] = get_reference_path(root, root_path)
+
+    def iter_children(self, data):
+        '''Yield (attr, value) of attributes to explore, then sampled items for collections'''
+        for attr in dir(data):
+            self.looped += 1
+            if attr.startswith('__') or attr in self.exclude:
+                continue
+            try:
+                yield attr, getattr(data, attr)
+            except AttributeError:
+                continue
+
+        if self.sample_size and isinstance(data, bpy.types.bpy_prop_collection):
+            for i, item in enumerate(islice(data, self.sample_size)):
+                yield f'[{i}]', item
+
+    def has_children(self, data) -> bool:
+        '''True if data has at least one element that would be explored'''
+        return any(value is not None and not callable(value) for _attr, value in self.iter_children(data))
+
+    def __iter__(self):
+        ## Explicit queue of (data, path, depth, children iterator) instead of recursion
+        ## depth-first works on last frame, breadth-first on first one
+        frames = deque([(self.root, self.root_path, 0, self.iter_children(self.root))])
+        self.checked += 1
+
+        while frames:
+            data, path, depth, children = frames[0] if self.breadth_first else frames[-1]
+            child = next(children, None)
+            if child is None:
+                if self.breadth_first:
+                    frames.popleft()
+                else:
+                    frames.pop()
+                continue
+
+            if self.max_nodes and self.count >= self.max_nodes:
+                self.truncated = True
+                return
+
+            attr, value = child
+            if value is None or callable(value):
+                continue
+
+            self.count += 1
+            if type(value) in leaf_types:
+                if type(value) is bpy.types.bpy_prop_array:
+                    value = array_values(value)
+                yield ApiNode(path, attr, value, depth, True)
+                continue
+
+            child_path = f'{path}{attr}' if attr.startswith('[') else f'{path}.{attr}'
+            if self.skip_visited:
+                key = get_identity(value, data, attr)
+                if key is not None:
+                    if (seen := self.visited.get(key)) is not None:
+                        # already explored, only yield a reference
+                        yield ApiNode(path, attr, value, depth, True, seen)
+                        continue
+                    self.visited[key] = get_reference_path(value, child_path)
+
+            size = -1
+            if self.sample_size and isinstance(value, bpy.types.bpy_prop_collection):
+                size = len(value)
+
+            yield ApiNode(path, attr, value, depth, False, size=size)
+            if self.max_depth and depth + 1 >= self.max_depth:
+                # deeper elements are not explored, only report a truncation when something was cut off
+                if not self.truncated and self.has_children(value):
+                    self.truncated = True
+                continue
+            if self.prune and self.prune(data, attr, value):
+                continue
+            frames.append((value, child_path, depth + 1, self.iter_children(value)))
+            self.checked += 1
+
+
+class SchemaPruner:
+    '''Walker prune callable skipping pointers and collections
+    whose RNA type cannot hold a property of the wanted kinds (checked in schema index)
+    Types unknown to the index are always explored'''
+
+    def __init__(self, schema, rna_kinds):
+        self.types = schema['types']
+        self.holding = api_schema.types_holding(schema, rna_kinds)
+        self.targets = {} # type name : {attr: fixed type}, filled on demand
+        self.pruned = 0
+
+    def get_target_type(self, owner, attr, value):
+        if isinstance(value, bpy.types.bpy_struct):
+            return value.bl_rna.identifier
+        if not isinstance(owner, bpy.types.bpy_struct):
+            return ''
+        owner_type = owner.bl_rna.identifier
+        targets = self.targets.get(owner_type)
+        if targets is None:
+            entry = self.types.get(owner_type)
+            props = entry['properties'] if entry else []
+            targets = self.targets[owner_type] = {
+                p[api_schema.PROP_ID]: p[api_schema.PROP_FIXED] for p in props if p[api_schema.PROP_FIXED]}
+        return targets.get(attr, '')
+
+    def __call__(self, owner, attr, value):
+        target = self.get_target_type(owner, attr, value)
+        if not target or target not in self.types or target in self.holding:
+            return False
+        self.pruned += 1
+        return True
+
+
 class DEV_OT_api_search(bpy.types.Operator):
     bl_idname = "dev.api_search"
     bl_label = "Api Search"
@@ -26,9 +290,96 @@ class DEV_OT_api_search(bpy.types.Operator):
     dump_api_tree : bpy.props.BoolProperty(name='Dump Tree in Clipboard',
     description='Traverse api at given path and copy into clipboard, else search mode')
 
+    dump_target : bpy.props.EnumProperty(name='Dump To',
+        default='CLIPBOARD',
+        items=(
+            ('CLIPBOARD', 'Clipboard', 'Collect whole tree as text and copy it to clipboard'),
+            ('FILE', 'File', 'Stream elements to a gzip compressed JSON Lines file as they are explored (low memory)\
+                \nDump can be searched and compared outside of Blender with api_dump.py'),
+        ),
+    )
+
+    dump_filepath : bpy.props.StringProperty(name='Dump File', subtype='FILE_PATH',
+    description='Destination of the .jsonl.gz dump, leave empty to write in devtools cache folder')
+
     search : bpy.props.StringProperty(name='Search',
     description='Word to search in api paths')
 
+    skip_visited : bpy.props.BoolProperty(name='Skip Visited', default=True,
+    description='Explore each datablock only once, repeated visits are written as a reference to the first path\
+        \nAvoid endless loops through back-references (users_scene, parent...)')
+
+    search_scope : bpy.props.EnumProperty(name='Search In',
+        default='DATA',
+        items=(
+            ('DATA', 'Data', 'Explore live data at data path (resolve instance values)'),
+            ('SCHEMA', 'Schema', 'Search property definitions in RNA schema index (instant, no instance values)\
+                \nWhen a data path is given, only types reachable from it are searched'),
+        ),
+    )
+
+    rebuild_schema : bpy.props.BoolProperty(name='Rebuild Schema Index', default=False,
+    description='Force rebuild of the RNA schema index cached on disk', options={'SKIP_SAVE'})
+
+    search_by : bpy.props.EnumProperty(name='Search By',
+        default='NAME',
+        items=(
+            ('NAME', 'Name', 'Search in attribute names'),
+            ('VALUE', 'Value', 'Search attributes holding a value matching a typed predicate\
+                \nStructs that cannot hold such value (checked in RNA schema index) are not explored'),
+        ),
+    )
+
+    value_predicate : bpy.props.EnumProperty(name='Predicate',
+        default='EXACT',
+        items=(
+            ('EXACT', 'Exact', 'Equal to searched value: text, number or sequence (ex: 0.35, "Cube", (1, 0, 0))'),
+            ('RANGE', 'Range', 'Number between minimum and maximum'),
+            ('REGEX', 'Regex', 'Text containing a regex match (case insensitive)'),
+            ('CLOSE', 'Close', 'Number, vector or matrix close to searched value within tolerance (ex: (1, 0, 0))'),
+        ),
+    )
+
+    value_min : bpy.props.FloatProperty(name='Minimum', default=0.0)
+
+    value_max : bpy.props.FloatProperty(name='Maximum', default=1.0)
+
+    tolerance : bpy.props.FloatProperty(name='Tolerance', default=0.001, min=0.0, precision=4)
+
+    match_mode : bpy.props.EnumProperty(name='Match',
+        default='FUZZY',
+        items=(
+            ('FUZZY', 'Fuzzy', 'Ranked match tolerant to typos and case style (frameStart, frame_start, "frame start")\
+                \nExplored attributes are indexed, next searches at the same data path reuse the index without exploring again'),
+            ('EXACT', 'Exact', 'Case sensitive substring match in attribute names, in exploration order'),
+        ),
+    )
+
+    refresh_index : bpy.props.BoolProperty(name='Refresh Index', default=False,
+    description='Explore data again instead of reusing index of a previous fuzzy search at the same data path',
+    options={'SKIP_SAVE'})
+
+    use_budget : bpy.props.BoolProperty(name='Budget', default=True,
+    description='Explore breadth-first with limits on explored elements and depth, and only sample collections items\
+        \nKeep exploration time bounded on heavy data (meshes, grease pencil drawings...)')
+
+    max_nodes : bpy.props.IntProperty(name='Max Elements', default=20000, min=0,
+    description='Stop exploration after this number of elements (0 = unlimited)')
+
+    max_depth : bpy.props.IntProperty(name='Max Depth', default=8, min=0,
+    description='Do not explore deeper than this level (0 = unlimited)')
+
+    sample_size : bpy.props.IntProperty(name='Collection Sample', default=3, min=0, soft_max=50,
+    description='Number of items explored in each collection, the rest is summed up by collection length\
+        \n0 = items are not explored and heavy attributes (data, polygons, loops...) are skipped')
+
+    time_sliced : bpy.props.BoolProperty(name='Run In Background', default=True,
+    description='Explore a bounded number of elements per timer tick so the interface stays responsive\
+        \nFound elements are listed live in text editor sidebar > Dev > Api Search Results, Esc to cancel')
+
+    nodes_per_tick : bpy.props.IntProperty(name='Elements Per Tick', default=400, min=1, soft_max=5000,
+    description='Number of elements explored on each timer tick when running in background')
+
     from_console : bpy.props.BoolProperty(name='From Console', default=False,
     description='Pop a panel', options={'SKIP_SAVE'})
 
@@ -42,47 +393,148 @@ class DEV_OT_api_search(bpy.types.Operator):
         if not self.from_console:
             row.activate_init = True # place cursor in field so user can start taping right away
         row.prop(self, 'data_path', text='Data Path')
-        
-        col.prop(self, 'dump_api_tree', text='Dump Api Tree To Clipboard')
+        col.row().prop(self, 'search_scope', expand=True)
+
+        is_schema = self.search_scope == 'SCHEMA'
+        if is_schema:
+            col.prop(self, 'rebuild_schema')
+        else:
+            col.prop(self, 'dump_api_tree', text='Dump Api Tree')
+            if self.dump_api_tree:
+                col.row().prop(self, 'dump_target', expand=True)
+                if self.dump_target == 'FILE':
+                    col.prop(self, 'dump_filepath', text='')
+            col.prop(self, 'skip_visited')
+            scol = col.column()
+            scol.active = not self.dump_api_tree
+            scol.row().prop(self, 'search_by', expand=True)
+            if self.search_by == 'VALUE':
+                scol.row().prop(self, 'value_predicate', expand=True)
+                if self.value_predicate == 'RANGE':
+                    row = scol.row(align=True)
+                    row.prop(self, 'value_min')
+                    row.prop(self, 'value_max')
+                elif self.value_predicate == 'CLOSE':
+                    scol.prop(self, 'tolerance')
+            else:
+                row = scol.row(align=True)
+                row.prop(self, 'match_mode', expand=True)
+                row.prop(self, 'refresh_index', text='', icon='FILE_REFRESH')
+            box = col.box()
+            bcol = box.column(align=True)
+            bcol.prop(self, 'use_budget')
+            sub = bcol.column(align=True)
+            sub.active = self.use_budget
+            sub.prop(self, 'max_nodes')
+            sub.prop(self, 'max_depth')
+            sub.prop(self, 'sample_size')
+            row = col.row(align=True)
+            row.prop(self, 'time_sliced')
+            sub = row.row(align=True)
+            sub.active = self.time_sliced
+            sub.prop(self, 'nodes_per_tick', text='Per Tick')
         
         row = col.row()
-        row.active = not self.dump_api_tree
+        row.active = is_schema or not self.dump_api_tree
         if self.from_console:
             row.activate_init = True # place cursor in field so user can start taping right away
         row.prop(self, 'search', text='Search')
 
-    def list_attr(self, path, ct=0, search_mode=False):
-        self.runned.append(path)
+    def dump_line(self, node, text):
+        '''Return dump line, indented tree for depth-first, full path for breadth-first'''
+        if self.walker.breadth_first:
+            return f'{node.path} : {text}'
+        return node.depth*'  ' + f'{node.attr} : {text}'
 
-        for attr in dir(eval(path)):
-            self.looped += 1
-            if not attr.startswith('__') and not attr in exclude:
-                try:
-                    value = getattr(eval(path),attr)
-                except AttributeError:
-                    value = None
-
-                if value != None:
-                    if not callable(value):
-                        if type(value) in ( type(0), type(0.0), type(True), type('str'), type(mathutils.Vector()), type(mathutils.Color()), type(mathutils.Matrix()) ):
-                            if search_mode:
-                                if self.search in attr:
-                                    self.found.append(f'{path}.{attr} : {value}')
-                                    print(ct*'  ' + attr, value)
-                            else:
-                                self.found.append(ct*'  ' + f'{attr} : {value}')
-                                
-                        else:
-                            if not search_mode:
-                                self.found.append(ct*'  ' + f'{attr} : {value} (type: {type(value)})')
-                            ct+=1
-                            # recursion
-                            self.list_attr('%s.%s'%(path,attr), ct, search_mode=search_mode)
+    def write_node(self, node):
+        '''Write node as a record in dump file'''
+        value = node.value
+        if type(value) not in json_types:
+            value = repr(value)
+        self.writer.write(node.path, type(node.value).__name__, value, node.ref)
+
+    def process_node(self, node, search_mode=False):
+        if self.writer:
+            self.write_node(node)
+
+        elif node.ref:
+            if not search_mode:
+                self.found.append(self.dump_line(node, f'-> see {node.ref}'))
+
+        elif node.leaf:
+            if search_mode and self.predicate is not None:
+                if self.predicate.match(node.value):
+                    self.found.append(f'{node.path} : {node.value}')
+
+            elif search_mode and self.index is not None:
+                line = f'{node.path} : {node.value}'
+                self.index.add(node.attr, line)
+                if fuzzy_search.candidate_score(self.query, self.index.keys[-1]) >= fuzzy_search.MIN_SCORE:
+                    self.found.append(line) # live hits, ranked when done
+
+            elif search_mode:
+                if self.search in node.attr:
+                    self.found.append(f'{node.path} : {node.value}')
+                    print(node.depth*'  ' + node.attr, node.value)
+            else:
+                self.found.append(self.dump_line(node, node.value))
+
+        elif not search_mode:
+            text = f'{node.value} (type: {type(node.value)})'
+            if node.size >= 0:
+                text += f' ({node.size} items, {min(node.size, self.walker.sample_size)} explored)'
+            self.found.append(self.dump_line(node, text))
+
+    def list_attr(self, walker, search_mode=False):
+        for node in walker:
+            self.process_node(node, search_mode)
+
+    def search_schema(self, context):
+        '''Search property definitions in schema index, restricted to types reachable from data path if any'''
+        if not self.search:
+            self.report({'ERROR'}, 'Need search term')
+            return {"CANCELLED"}
+
+        start = time.perf_counter()
+        schema = api_schema.get_schema(rebuild=self.rebuild_schema)
+
+        type_names = None
+        dt = self.data_path.rstrip('. ')
+        if dt:
+            try:
+                root_type = api_schema.get_type_name(resolve_data_path(dt))
+            except Exception as e:
+                self.report({'ERROR'}, f'Could not resolve data path: {e}')
+                return {"CANCELLED"}
+            if root_type:
+                type_names = api_schema.reachable_types(schema, root_type)
+
+        hits = api_schema.search_schema(self.search, type_names=type_names, schema=schema)
+        self.found = [api_schema.format_schema_hit(type_name, prop) for type_name, prop in hits]
+        print(f'\nSchema search "{self.search}": {len(self.found)} found in {(time.perf_counter() - start) * 1000:.1f}ms')
+        for f in self.found:
+            print(f)
+
+        if not self.found:
+            self.report({'WARNING'}, f'Nothing found for "{self.search}"')
+            return {"FINISHED"}
+
+        context.window_manager.clipboard = '\n'.join(self.found)
+        self.report({'INFO'}, f'{len(self.found)} definitions copied, see console')
+        return {"FINISHED"}
+
+    def get_index_key(self, data_path) -> tuple:
+        '''Key of fuzzy index in path_indexes, exploration settings change explored attributes'''
+        if self.use_budget:
+            return (data_path, self.skip_visited, self.max_nodes, self.max_depth, self.sample_size)
+        return (data_path, self.skip_visited)
 
     def execute(self, context):
         self.found = []
-        self.runned = []
-        self.looped = 0
+        self.index_date = ''
+
+        if self.search_scope == 'SCHEMA':
+            return self.search_schema(context)
 
         dt = self.data_path
         if not dt:
@@ -90,9 +542,175 @@ class DEV_OT_api_search(bpy.types.Operator):
             return {"CANCELLED"}
         
         dt = dt.rstrip('. ')
-        self.list_attr(dt, search_mode = not self.dump_api_tree)
-        print ('\nDone')
-        print('checked', len(self.runned))
+
+        self.index = None
+        self.writer = None
+        self.predicate = None
+        self.pruner = None
+        if not self.dump_api_tree and self.search_by == 'VALUE':
+            try:
+                self.predicate = api_values.make_predicate(self.value_predicate, self.search,
+                    minimum=self.value_min, maximum=self.value_max, tolerance=self.tolerance)
+            except ValueError as e:
+                self.report({'ERROR'}, str(e))
+                return {"CANCELLED"}
+            self.pruner = SchemaPruner(api_schema.get_schema(), self.predicate.kinds)
+
+        elif not self.dump_api_tree and self.match_mode == 'FUZZY':
+            if not self.search:
+                self.report({'ERROR'}, 'Need search term')
+                return {"CANCELLED"}
+            self.query = fuzzy_search.Query(self.search)
+            if not self.refresh_index and (cached := path_indexes.get(self.get_index_key(dt))):
+                ## Reuse index of previous exploration, values are the ones read at that time
+                self.index, self.index_date = cached
+                self.walker = None
+                return self.finish(context)
+            self.index = fuzzy_search.TrigramIndex()
+
+        try:
+            root = resolve_data_path(dt)
+        except Exception as e:
+            self.report({'ERROR'}, f'Could not resolve data path: {e}')
+            return {"CANCELLED"}
+
+        if self.use_budget:
+            self.walker = ApiWalker(root, dt, skip_visited=self.skip_visited, breadth_first=True,
+                max_nodes=self.max_nodes, max_depth=self.max_depth, sample_size=self.sample_size,
+                prune=self.pruner)
+        else:
+            self.walker = ApiWalker(root, dt, skip_visited=self.skip_visited, prune=self.pruner)
+
+        if self.time_sliced and live_search['running']:
+            self.report({'ERROR'}, 'An api search is already running (Esc to cancel it)')
+            return {"CANCELLED"}
+
+        if self.dump_api_tree and self.dump_target == 'FILE':
+            filepath = self.get_dump_filepath()
+            try:
+                self.writer = api_dump.DumpWriter(filepath, root=dt, blender=bpy.app.version_string)
+            except OSError as e:
+                self.report({'ERROR'}, f'Could not open dump file: {e}')
+                return {"CANCELLED"}
+
+        if self.time_sliced:
+            return self.start_modal(context)
+
+        try:
+            self.list_attr(self.walker, search_mode = not self.dump_api_tree)
+        except Exception as e:
+            self.report({'ERROR'}, f'Api search stopped after {self.walker.checked} elements: {e}')
+            return {"CANCELLED"}
+        finally:
+            ## dump file is always closed (valid gzip, partial on error)
+            if self.writer:
+                self.writer.close()
+        return self.finish(context)
+
+    def get_dump_filepath(self):
+        if self.dump_filepath:
+            filepath = Path(bpy.path.abspath(self.dump_filepath))
+            if filepath.is_dir() or self.dump_filepath.endswith(('\\', '/')):
+                filepath = filepath / f'api_dump_{time.strftime("%Y-%m-%d_%H-%M-%S")}.jsonl.gz'
+        else:
+            filepath = fn.get_cache_dir() / 'api_dumps' / f'api_dump_{time.strftime("%Y-%m-%d_%H-%M-%S")}.jsonl.gz'
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        return filepath
+
+    ## Time-sliced exploration
+
+    def start_modal(self, context):
+        live_search.update(
+            running=True,
+            cancel=False,
+            data_path=self.walker.root_path,
+            search='' if self.dump_api_tree else self.search,
+            checked=0,
+            found=self.found,
+            status='Running',
+        )
+        self.nodes = iter(self.walker)
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        self._last_tick = 0.0
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def stop_modal(self, context, status):
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        if self.writer:
+            self.writer.close()
+        live_search.update(running=False, checked=self.walker.checked, status=status)
+        redraw_results_panel(context)
+
+    def modal(self, context, event):
+        if (event.type == 'ESC' and event.value == 'PRESS') or live_search['cancel']:
+            self.stop_modal(context, 'Cancelled')
+            self.report({'WARNING'}, f'Api search cancelled after {self.walker.checked} elements')
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        ## Only step on own timer (Event does not expose which timer fired, own timer time changes when it did)
+        if self._timer.time_duration == self._last_tick:
+            return {'PASS_THROUGH'}
+        self._last_tick = self._timer.time_duration
+
+        search_mode = not self.dump_api_tree
+        count = 0
+        try:
+            for node in islice(self.nodes, self.nodes_per_tick):
+                self.process_node(node, search_mode)
+                count += 1
+        except Exception as e:
+            ## ex: ReferenceError on data removed while searching, always release timer and running state
+            self.stop_modal(context, 'Error')
+            self.report({'ERROR'}, f'Api search stopped after {self.walker.checked} elements: {e}')
+            return {'CANCELLED'}
+
+        if count < self.nodes_per_tick:
+            # walker exhausted
+            self.stop_modal(context, 'Done')
+            self.finish(context)
+            return {'FINISHED'}
+
+        live_search['checked'] = self.walker.checked
+        if self.writer:
+            progress = f'{self.writer.count} written'
+        else:
+            progress = f'{len(self.found)} found'
+        context.workspace.status_text_set(
+            f'Api search: {self.walker.checked} explored, {progress} (Esc to cancel)')
+        redraw_results_panel(context)
+        return {'PASS_THROUGH'}
+
+    def finish(self, context):
+        if self.walker:
+            print ('\nDone')
+            print('checked', self.walker.checked)
+            if self.walker.truncated:
+                print(f'Budget reached, exploration truncated (max elements {self.max_nodes}, max depth {self.max_depth})')
+            if self.pruner:
+                print(f'{self.pruner.pruned} subtrees skipped (cannot hold a matching value)')
+
+        if self.index is not None:
+            start = time.perf_counter()
+            if not self.index_date:
+                path_indexes[self.get_index_key(self.data_path.rstrip('. '))] = (self.index, time.strftime('%H:%M:%S'))
+            else:
+                print(f'Reused index explored at {self.index_date}, values may be outdated (Refresh Index to explore again)')
+            self.found = [line for _score, line in self.index.search(self.query)]
+            print(f'Ranked {len(self.found)} matches among {len(self.index)} indexed attributes in {(time.perf_counter() - start) * 1000:.1f}ms')
+            if self.time_sliced:
+                live_search['found'] = self.found
+
+        if self.writer:
+            self.writer.close()
+            print(f'{self.writer.count} elements written to {self.writer.filepath}')
+            self.report({'INFO'}, f'Api dump saved: {self.writer.filepath}')
+            return {"FINISHED"}
 
         if self.dump_api_tree:
             context.window_manager.clipboard = '\n'.join(self.found)
@@ -101,7 +719,10 @@ class DEV_OT_api_search(bpy.types.Operator):
             return {"FINISHED"}
         
         if self.found:
-            self.report({'INFO'}, f'{len(self.found)} elements copied, see console')
+            if self.index_date:
+                self.report({'INFO'}, f'{len(self.found)} elements copied, values cached at {self.index_date} (Refresh Index to update)')
+            else:
+                self.report({'INFO'}, f'{len(self.found)} elements copied, see console')
             for f in self.found:
                 print(f)
             
@@ -114,8 +735,94 @@ class DEV_OT_api_search(bpy.types.Operator):
         return {"FINISHED"}
 
 
+@bpy.app.handlers.persistent
+def cancel_on_undo(*args):
+    '''Explored structs may be freed by undo/redo, running search stops before its next step'''
+    if live_search['running']:
+        live_search['cancel'] = True
+
+@bpy.app.handlers.persistent
+def cancel_on_load(*args):
+    '''Modal handlers are removed on file load, search state is released here'''
+    if live_search['running']:
+        live_search.update(running=False, cancel=True, status='Cancelled (file loaded)')
+
+search_handlers = (
+(bpy.app.handlers.undo_pre, cancel_on_undo),
+(bpy.app.handlers.redo_pre, cancel_on_undo),
+(bpy.app.handlers.load_pre, cancel_on_load),
+)
+
+def redraw_results_panel(context):
+    for area in context.screen.areas:
+        if area.type == 'TEXT_EDITOR':
+            area.tag_redraw()
+
+class DEV_OT_api_search_cancel(bpy.types.Operator):
+    bl_idname = "dev.api_search_cancel"
+    bl_label = "Cancel Api Search"
+    bl_description = "Stop running api search, or clear results of the last one"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    def execute(self, context):
+        if live_search['running']:
+            live_search['cancel'] = True
+        else:
+            live_search.update(data_path='', found=[], status='')
+        return {"FINISHED"}
+
+class DEV_PT_api_search_results(bpy.types.Panel):
+    bl_space_type = "TEXT_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Dev"
+    bl_label = "Api Search Results"
+
+    max_lines = 30 # only last found elements are listed
+
+    @classmethod
+    def poll(cls, context):
+        return live_search['data_path']
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        row = col.row()
+        row.label(text=f"{live_search['status']}: {live_search['data_path']}")
+        if live_search['running']:
+            row.operator('dev.api_search_cancel', text='', icon='CANCEL')
+        else:
+            row.operator('dev.api_search_cancel', text='', icon='X')
+
+        if live_search['search']:
+            col.label(text=f"Search: {live_search['search']}")
+        found = live_search['found']
+        col.label(text=f"{live_search['checked']} explored, {len(found)} found")
+
+        if not found:
+            return
+        box = layout.box()
+        bcol = box.column(align=True)
+        if len(found) > self.max_lines:
+            bcol.label(text=f'... {len(found) - self.max_lines} more (see console)')
+        for line in found[-self.max_lines:]:
+            bcol.label(text=line)
+
+
+classes = (
+DEV_OT_api_search,
+DEV_OT_api_search_cancel,
+DEV_PT_api_search_results,
+)
+
 def register():
-    bpy.utils.register_class(DEV_OT_api_search)
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    for handlers, func in search_handlers:
+        handlers.append(func)
 
 def unregister():
-    bpy.utils.unregister_class(DEV_OT_api_search)
\ No newline at end of file
+    for handlers, func in search_handlers:
+        if func in handlers:
+            handlers.remove(func)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,166 @@
+import bpy
+import json
+import time
+from collections import defaultdict
+from . import fn
+
+## Rows stored per type in the schema index
+## property: [identifier, rna type, name, description, fixed type, enum items]
+## function: [identifier, description, parameters identifiers]
+PROP_ID, PROP_TYPE, PROP_NAME, PROP_DESC, PROP_FIXED, PROP_ENUM = range(6)
+
+SCHEMA_FORMAT = 1 # increment when index layout changes
+SCHEMA_FILENAME = 'rna_schema.json'
+
+_schema = None # loaded index, kept for the session
+
+def get_build_key() -> dict:
+    '''Identify current Blender build, index is rebuilt when it changes'''
+    build_hash = bpy.app.build_hash
+    if isinstance(build_hash, bytes):
+        build_hash = build_hash.decode('utf-8', 'ignore')
+    return {
+        'format': SCHEMA_FORMAT,
+        'version': list(bpy.app.version),
+        'build_hash': build_hash,
+    }
+
+def build_schema() -> dict:
+    '''Introspect all bpy.types RNA definitions and return the schema index'''
+    types = {}
+    for type_name in dir(bpy.types):
+        try:
+            rna = getattr(bpy.types, type_name).bl_rna
+        except Exception:
+            continue
+        if rna.identifier != type_name:
+            continue
+
+        properties = []
+        for prop in rna.properties:
+            if prop.identifier == 'rna_type':
+                continue
+            fixed_type = ''
+            if prop.type in ('POINTER', 'COLLECTION') and prop.fixed_type:
+                fixed_type = prop.fixed_type.identifier
+            enum_items = []
+            if prop.type == 'ENUM':
+                enum_items = [item.identifier for item in prop.enum_items]
+            properties.append([prop.identifier, prop.type, prop.name, prop.description, fixed_type, enum_items])
+
+        functions = []
+        for func in rna.functions:
+            functions.append([func.identifier, func.description, [p.identifier for p in func.parameters]])
+
+        types[type_name] = {
+            'base': rna.base.identifier if rna.base else '',
+            'description': rna.description,
+            'properties': properties,
+            'functions': functions,
+        }
+
+    return {'key': get_build_key(), 'types': types}
+
+def get_schema(rebuild=False) -> dict:
+    '''Return the schema index
+    Loaded from disk cache when build matches, else built and saved'''
+    global _schema
+
+    key = get_build_key()
+    if not rebuild and _schema and _schema['key'] == key:
+        return _schema
+
+    cache_file = fn.get_cache_dir() / SCHEMA_FILENAME
+    if not rebuild and cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as fd:
+                schema = json.load(fd)
+            if schema.get('key') == key:
+                _schema = schema
+                return _schema
+        except (OSError, ValueError) as e:
+            print(f'Could not read schema cache {cache_file}: {e}')
+
+    start = time.perf_counter()
+    _schema = build_schema()
+    print(f'RNA schema index built in {time.perf_counter() - start:.2f}s ({len(_schema["types"])} types)')
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as fd:
+            json.dump(_schema, fd, separators=(',', ':'))
+    except OSError as e:
+        print(f'Could not write schema cache {cache_file}: {e}')
+    return _schema
+
+def get_type_name(value) -> str:
+    '''Return RNA type identifier of a value, empty string if not a struct'''
+    if isinstance(value, bpy.types.bpy_struct):
+        return value.bl_rna.identifier
+    return ''
+
+def reachable_types(schema, type_name) -> set:
+    '''Return set of type names reachable from type_name through pointers and collections'''
+    types = schema['types']
+    reached = {type_name}
+    stack = [type_name]
+    while stack:
+        entry = types.get(stack.pop())
+        if not entry:
+            continue
+        for prop in entry['properties']:
+            fixed_type = prop[PROP_FIXED]
+            if fixed_type and fixed_type not in reached:
+                reached.add(fixed_type)
+                stack.append(fixed_type)
+    return reached
+
+def types_holding(schema, rna_kinds) -> set:
+    '''Return set of type names having a property of one of rna_kinds (ex: {'FLOAT', 'INT'}),
+    directly or through any chain of pointers and collections'''
+    referrers = defaultdict(set) # type name : types pointing to it
+    holding = set()
+    for type_name, entry in schema['types'].items():
+        for prop in entry['properties']:
+            if prop[PROP_TYPE] in rna_kinds:
+                holding.add(type_name)
+            if prop[PROP_FIXED]:
+                referrers[prop[PROP_FIXED]].add(type_name)
+
+    stack = list(holding)
+    while stack:
+        for referrer in referrers.get(stack.pop(), ()):
+            if referrer not in holding:
+                holding.add(referrer)
+                stack.append(referrer)
+    return holding
+
+def search_schema(search, type_names=None, schema=None) -> list:
+    '''Return list of (type name, property row) whose identifier or name contains search (case insensitive)
+    type_names: optional iterable restricting searched types
+    '''
+    schema = schema or get_schema()
+    search = search.lower()
+    types = schema['types']
+    if type_names is None:
+        type_names = types.keys()
+
+    found = []
+    for type_name in sorted(type_names):
+        entry = types.get(type_name)
+        if not entry:
+            continue
+        for prop in entry['properties']:
+            if search in prop[PROP_ID].lower() or search in prop[PROP_NAME].lower():
+                found.append((type_name, prop))
+    return found
+
+def format_schema_hit(type_name, prop) -> str:
+    '''Return a one line description of a property row'''
+    rna_type = prop[PROP_TYPE]
+    if prop[PROP_FIXED]:
+        rna_type = f'{rna_type} -> {prop[PROP_FIXED]}'
+    line = f'{type_name}.{prop[PROP_ID]} ({rna_type})'
+    if prop[PROP_ENUM]:
+        line += f' [{", ".join(prop[PROP_ENUM])}]'
+    if prop[PROP_DESC]:
+        line += f' : {prop[PROP_DESC]}'
+    return line
@@ -0,0 +1,244 @@
+import bpy
+import time
+from hashlib import blake2b
+from .api_explore import ApiWalker, resolve_data_path
+
+## Captured snapshots by name, kept for the session
+snapshots = {}
+
+class SnapNode:
+    '''Snapshot tree element, digest hashes the whole subtree (merkle tree)'''
+    __slots__ = ('value', 'children', 'digest')
+
+    def __init__(self, value=''):
+        self.value = value # repr for leaves, type name for structs
+        self.children = {} # attr : SnapNode
+        self.digest = b''
+
+class Snapshot:
+    def __init__(self, data_path, root, count, settings):
+        self.data_path = data_path
+        self.root = root
+        self.count = count
+        self.settings = settings # walker settings, reused to capture comparable state
+        self.date = time.strftime('%H:%M:%S')
+
+def hash_tree(root):
+    '''Compute digests bottom-up, children before parents'''
+    ## iterative post-order: parents are listed before children, so hash in reverse
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(node.children.values())
+
+    for node in reversed(order):
+        h = blake2b(node.value.encode('utf-8', 'replace'), digest_size=16)
+        for attr in sorted(node.children):
+            h.update(attr.encode('utf-8'))
+            h.update(node.children[attr].digest)
+        node.digest = h.digest()
+
+def capture(data_path, max_nodes=200000, max_depth=10, sample_size=100) -> Snapshot:
+    '''Explore data at path and return a hashed Snapshot
+    Raise ValueError if data path cannot be resolved'''
+    try:
+        data = resolve_data_path(data_path)
+    except Exception as e:
+        raise ValueError(f'Could not resolve data path: {e}') from e
+
+    settings = {'max_nodes': max_nodes, 'max_depth': max_depth, 'sample_size': sample_size}
+    walker = ApiWalker(data, data_path, skip_visited=True, **settings)
+
+    root = SnapNode(type(data).__name__)
+    ## open structs by depth, depth-first order guarantees parent is the last open at depth - 1
+    stack = [root]
+    for node in walker:
+        del stack[node.depth + 1:]
+        if node.ref:
+            snap = SnapNode(f'-> {node.ref}')
+        elif node.leaf:
+            snap = SnapNode(repr(node.value))
+        else:
+            label = type(node.value).__name__
+            if node.size >= 0:
+                label += f'[{node.size}]'
+            snap = SnapNode(label)
+            stack.append(snap)
+        stack[node.depth].children[node.attr] = snap
+
+    hash_tree(root)
+    return Snapshot(data_path, root, walker.count, settings)
+
+def join_path(path, attr):
+    return f'{path}{attr}' if attr.startswith('[') else f'{path}.{attr}'
+
+def diff_snapshots(old, new) -> list:
+    '''Return list of (path, old value, new value), only descend in subtrees with different digests
+    old or new value is None when element was added or removed'''
+    changes = []
+    stack = [(old.root, new.root, old.data_path)]
+    while stack:
+        old_node, new_node, path = stack.pop()
+        if old_node.digest == new_node.digest:
+            continue
+
+        if not old_node.children and not new_node.children:
+            changes.append((path, old_node.value, new_node.value))
+            continue
+
+        if old_node.value != new_node.value:
+            changes.append((path, old_node.value, new_node.value))
+
+        for attr in sorted(old_node.children.keys() | new_node.children.keys(), reverse=True):
+            old_child = old_node.children.get(attr)
+            new_child = new_node.children.get(attr)
+            child_path = join_path(path, attr)
+            if old_child is None:
+                changes.append((child_path, None, new_child.value))
+            elif new_child is None:
+                changes.append((child_path, old_child.value, None))
+            else:
+                stack.append((old_child, new_child, child_path))
+    return changes
+
+
+class DEV_OT_api_snapshot(bpy.types.Operator):
+    bl_idname = "dev.api_snapshot"
+    bl_label = "Api Snapshot"
+    bl_description = "Capture a hashed snapshot of api data at datapath, to compare it later with Api Snapshot Diff"
+    bl_options = {"REGISTER"}
+
+    data_path : bpy.props.StringProperty(name='Data Path',
+    description='Api data path to capture')
+
+    name : bpy.props.StringProperty(name='Name', default='A',
+    description='Name of the snapshot, an existing snapshot with same name is replaced')
+
+    max_nodes : bpy.props.IntProperty(name='Max Elements', default=200000, min=0,
+    description='Stop capture after this number of elements (0 = unlimited)')
+
+    max_depth : bpy.props.IntProperty(name='Max Depth', default=10, min=0,
+    description='Do not capture deeper than this level (0 = unlimited)')
+
+    sample_size : bpy.props.IntProperty(name='Collection Sample', default=100, min=0,
+    description='Number of items captured in each collection')
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        col.prop(self, 'data_path')
+        col.prop(self, 'name')
+        col.separator()
+        col.prop(self, 'max_nodes')
+        col.prop(self, 'max_depth')
+        col.prop(self, 'sample_size')
+
+    def execute(self, context):
+        dt = self.data_path.rstrip('. ')
+        if not dt:
+            self.report({'ERROR'}, 'no data path given')
+            return {"CANCELLED"}
+
+        start = time.perf_counter()
+        try:
+            snapshots[self.name] = capture(dt, max_nodes=self.max_nodes,
+                max_depth=self.max_depth, sample_size=self.sample_size)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {"CANCELLED"}
+
+        snap = snapshots[self.name]
+        self.report({'INFO'}, f'Snapshot "{self.name}": {snap.count} elements at {dt} ({time.perf_counter() - start:.2f}s)')
+        return {"FINISHED"}
+
+
+class DEV_OT_api_snapshot_diff(bpy.types.Operator):
+    bl_idname = "dev.api_snapshot_diff"
+    bl_label = "Api Snapshot Diff"
+    bl_description = "List changed api paths between two snapshots, with old and new values (print and copy to clipboard)"
+    bl_options = {"REGISTER"}
+
+    old : bpy.props.StringProperty(name='Old', default='A',
+    description='Name of the reference snapshot')
+
+    use_current : bpy.props.BoolProperty(name='Compare With Current State', default=True,
+    description='Capture current state at same data path and with same settings as old snapshot (stored as New)')
+
+    new : bpy.props.StringProperty(name='New', default='B',
+    description='Name of the snapshot to compare')
+
+    @classmethod
+    def poll(cls, context):
+        return snapshots
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column()
+        col.prop(self, 'old')
+        col.prop(self, 'use_current')
+        col.prop(self, 'new')
+        col.separator()
+        for name, snap in snapshots.items():
+            col.label(text=f'{name}: {snap.data_path} ({snap.count} elements, {snap.date})')
+
+    def execute(self, context):
+        old = snapshots.get(self.old)
+        if old is None:
+            self.report({'ERROR'}, f'No snapshot named "{self.old}"')
+            return {"CANCELLED"}
+
+        start = time.perf_counter()
+        if self.use_current:
+            try:
+                snapshots[self.new] = capture(old.data_path, **old.settings)
+            except ValueError as e:
+                self.report({'ERROR'}, str(e))
+                return {"CANCELLED"}
+
+        new = snapshots.get(self.new)
+        if new is None:
+            self.report({'ERROR'}, f'No snapshot named "{self.new}"')
+            return {"CANCELLED"}
+
+        changes = diff_snapshots(old, new)
+        print(f'\nSnapshot diff {self.old} -> {self.new}: {len(changes)} changes ({time.perf_counter() - start:.2f}s)')
+        lines = []
+        for path, old_value, new_value in changes:
+            if old_value is None:
+                lines.append(f'+ {path} : {new_value}')
+            elif new_value is None:
+                lines.append(f'- {path} : {old_value}')
+            else:
+                lines.append(f'~ {path} : {old_value} -> {new_value}')
+        for l in lines:
+            print(l)
+
+        if not lines:
+            self.report({'INFO'}, 'No change')
+            return {"FINISHED"}
+
+        context.window_manager.clipboard = '\n'.join(lines)
+        self.report({'INFO'}, f'{len(lines)} changes copied, see console')
+        return {"FINISHED"}
+
+
+classes = (
+DEV_OT_api_snapshot,
+DEV_OT_api_snapshot_diff,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
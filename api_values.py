@@ -0,0 +1,147 @@
+'''Typed value predicates for api value search
+Each predicate tells which RNA property types can hold a matching value,
+so that exploration can skip structs without such properties
+'''
+import ast
+import re
+from abc import ABC, abstractmethod
+
+NUMERIC_KINDS = {'INT', 'FLOAT', 'BOOLEAN'}
+TEXT_KINDS = {'STRING', 'ENUM'}
+
+def parse_literal(text):
+    '''Return python literal from text (number, tuple...), or the stripped text itself
+    Raise ValueError on literals that cannot be evaluated (ex: unhashable dict key, too deeply nested)'''
+    try:
+        return ast.literal_eval(text.strip())
+    except (ValueError, SyntaxError):
+        return text.strip()
+    except (TypeError, RecursionError, MemoryError) as e:
+        raise ValueError(f'Invalid value {text[:50]!r}: {type(e).__name__}') from None
+
+def is_bool(value) -> bool:
+    '''True for a bool or a sequence of bools (ex: lock_location)'''
+    if isinstance(value, bool):
+        return True
+    return isinstance(value, (tuple, list)) and len(value) > 0 and all(isinstance(v, bool) for v in value)
+
+def flatten(value):
+    '''Return tuple of floats from a number, vector, color, matrix or nested sequence
+    None when value is not numeric'''
+    if isinstance(value, (int, float)):
+        return (float(value),)
+    if isinstance(value, str):
+        return None
+    try:
+        items = list(value)
+    except TypeError:
+        return None
+    flat = []
+    for item in items:
+        sub = flatten(item)
+        if sub is None:
+            return None
+        flat.extend(sub)
+    return tuple(flat)
+
+def numbers_close(a, b, tolerance) -> bool:
+    '''Compare two flattened number tuples'''
+    return len(a) == len(b) and all(abs(x - y) <= tolerance for x, y in zip(a, b))
+
+
+class ValuePredicate(ABC):
+    '''Base predicate, kinds is the set of RNA property types that can hold a matching value'''
+    kinds = set()
+
+    @abstractmethod
+    def match(self, value) -> bool:
+        '''True if an explored leaf value matches'''
+
+
+class ExactPredicate(ValuePredicate):
+    '''Equal to a string, number or sequence (floats compared with a tiny epsilon)
+    Booleans only match a boolean searched value (1 does not match every True property)'''
+
+    def __init__(self, text, epsilon=1e-6):
+        self.target = parse_literal(text)
+        self.epsilon = epsilon
+        if isinstance(self.target, str):
+            self.kinds = TEXT_KINDS
+            self.flat = None
+        else:
+            self.flat = flatten(self.target)
+            if self.flat is None:
+                raise ValueError(f'Unsupported value: {text}')
+            self.kinds = NUMERIC_KINDS
+            self.bool_target = is_bool(self.target)
+
+    def match(self, value) -> bool:
+        if self.flat is None:
+            return isinstance(value, str) and value == self.target
+        if isinstance(value, str) or is_bool(value) != self.bool_target:
+            return False
+        flat = flatten(value)
+        return flat is not None and numbers_close(flat, self.flat, self.epsilon)
+
+
+class RangePredicate(ValuePredicate):
+    '''Number between minimum and maximum (included)'''
+    kinds = {'INT', 'FLOAT'}
+
+    def __init__(self, minimum, maximum):
+        if minimum > maximum:
+            raise ValueError(f'Range minimum {minimum} is greater than maximum {maximum}')
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def match(self, value) -> bool:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return self.minimum <= value <= self.maximum
+
+
+class RegexPredicate(ValuePredicate):
+    '''String containing a regex match (case insensitive)'''
+    kinds = TEXT_KINDS
+
+    def __init__(self, pattern):
+        try:
+            self.regex = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f'Invalid regex: {e}') from e
+
+    def match(self, value) -> bool:
+        return isinstance(value, str) and self.regex.search(value) is not None
+
+
+class ClosePredicate(ValuePredicate):
+    '''Number, vector or matrix approximately equal to target within tolerance'''
+    kinds = {'INT', 'FLOAT'}
+
+    def __init__(self, text, tolerance):
+        self.flat = flatten(parse_literal(text))
+        if self.flat is None:
+            raise ValueError(f'Need a number or a sequence of numbers, got: {text}')
+        self.tolerance = tolerance
+
+    def match(self, value) -> bool:
+        if isinstance(value, (str, bool)):
+            return False
+        flat = flatten(value)
+        return flat is not None and numbers_close(flat, self.flat, self.tolerance)
+
+
+def make_predicate(mode, text='', minimum=0.0, maximum=0.0, tolerance=0.001) -> ValuePredicate:
+    '''Return predicate for mode in (EXACT, RANGE, REGEX, CLOSE)
+    Raise ValueError when text cannot be used with mode'''
+    if mode == 'RANGE':
+        return RangePredicate(minimum, maximum)
+    if not text.strip():
+        raise ValueError('Need a value to search')
+    if mode == 'EXACT':
+        return ExactPredicate(text)
+    if mode == 'REGEX':
+        return RegexPredicate(text)
+    if mode == 'CLOSE':
+        return ClosePredicate(text, tolerance)
+    raise ValueError(f'Unknown predicate: {mode}')
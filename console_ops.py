@@ -5,6 +5,7 @@ from . import fn
 from bpy.props import (
                 BoolProperty,
                 StringProperty,
+                EnumProperty,
                 CollectionProperty,
                 )
 
@@ -166,11 +167,20 @@ class DEV_OT_console_api_search(bpy.types.Operator):
     search : StringProperty(name='Search',
     description='Word to search in api paths')
 
+    search_scope : EnumProperty(name='Search In',
+        default='DATA',
+        items=(
+            ('DATA', 'Data', 'Explore live data at console line data path'),
+            ('SCHEMA', 'Schema', 'Search property definitions in RNA schema index (instant, no instance values)'),
+        ),
+    )
+
     def invoke(self, context, event):
         self.line = context.area.spaces.active.history[-1].body
         self.line = self.line.strip().rstrip('.').replace('C.', 'bpy.context.').replace('D.', 'bpy.data.')
         if not self.line:
-            self.report({'ERROR'} , 'Empty line')
+            self.report({'WARNING'} , 'Empty line, only schema search is available')
+            self.search_scope = 'SCHEMA'
         return context.window_manager.invoke_props_dialog(self)
     
     def draw(self, context):
@@ -179,18 +189,24 @@ class DEV_OT_console_api_search(bpy.types.Operator):
         row = col.row()
         row.activate_init = True # place cursor in field
         row.prop(self, 'search', text='Search')
-        col.label(text=f"In: {self.line}")
+        col.row().prop(self, 'search_scope', expand=True)
+        col.label(text=f"In: {self.line or 'all types'}")
 
     def execute(self, context):
         if not self.search:
             self.report({'ERROR'}, 'Need search term')
             return {"CANCELLED"}
 
+        if not self.line and self.search_scope == 'DATA':
+            self.report({'ERROR'}, 'Empty line')
+            return {"CANCELLED"}
+
         bpy.ops.dev.api_search(
             'EXEC_DEFAULT', # no need invoke if from console is used
             data_path=self.line,
             dump_api_tree=False,
             search=self.search,
+            search_scope=self.search_scope,
             from_console=True
             )
         return {"FINISHED"}
@@ -371,6 +387,11 @@ class DEV_MT_console_dev(bpy.types.Menu):
         ops.dump_api_tree = True
         ops.from_console = True
 
+        layout.operator('dev.ops_catalog_search', text='Search Operators')
+
+        ## Snapshots
+        layout.operator('dev.api_snapshot', text='Snapshot At Datapath').data_path = context.area.spaces.active.history[-1].body.rstrip('. ') or 'bpy.context.scene'
+        layout.operator('dev.api_snapshot_diff', text='Diff With Snapshot')
         
         ## History
         # layout.operator("wm.call_panel", text="History").name = "DEV_PT_console_history_lines" # old direct panel
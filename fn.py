@@ -15,6 +15,10 @@ def get_addon_prefs():
     addon_prefs = preferences.addons[addon_name].preferences
     return (addon_prefs)
 
+def get_cache_dir() -> Path:
+    '''Return devtools cache folder in user datafiles (created if needed)'''
+    return Path(bpy.utils.user_resource('DATAFILES', path='devtools_cache', create=True))
+
 def get_external_editor():
     editor = get_addon_prefs().external_editor.strip()
     if not editor:
@@ -0,0 +1,136 @@
+'''Ranked fuzzy matching with a trigram index
+Pure python (no bpy), keys are normalized so camelCase, snake_case and spaced words match each other
+'''
+import re
+from collections import defaultdict
+
+MIN_SCORE = 20.0 # lowest score considered a match
+
+re_tokens = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+
+def split_tokens(text) -> list:
+    '''Split text in lowercase words on case changes, digits and any separator
+    ex: "frameStart", "frame_start" and "Frame Start" -> ['frame', 'start']
+    '''
+    return [t.lower() for t in re_tokens.findall(text)]
+
+def normalize(text) -> str:
+    '''Return snake_case key used for matching'''
+    return '_'.join(split_tokens(text))
+
+def trigrams(key) -> set:
+    '''Return set of trigrams of a normalized key (padded to weight word start)'''
+    padded = f'  {key} '
+    return {padded[i:i+3] for i in range(len(padded) - 2)}
+
+def is_subsequence(query, key) -> bool:
+    '''True if all characters of query appear in key in the same order'''
+    it = iter(key)
+    return all(c in it for c in query)
+
+
+class Query:
+    '''Search text prepared once for repeated scoring'''
+
+    def __init__(self, text):
+        self.text = text
+        self.key = normalize(text)
+        self.tokens = self.key.split('_') if self.key else []
+        self.grams = trigrams(self.key) if self.key else set()
+
+
+def score(query, key, key_grams=None) -> float:
+    '''Return match score of a normalized key against a Query, 0 when not matching
+    Ranks: exact > prefix > word boundary > substring > all words > typo (trigram similarity) > subsequence
+    Shorter keys rank slightly higher within a same rank
+    '''
+    qkey = query.key
+    if not qkey or not key:
+        return 0.0
+
+    penalty = min(len(key), 100) / 100
+    if key == qkey:
+        return 100.0
+    if key.startswith(qkey):
+        return 90.0 - penalty
+    if f'_{qkey}' in key:
+        return 80.0 - penalty
+    if qkey in key:
+        return 70.0 - penalty
+
+    key_tokens = key.split('_')
+    if len(query.tokens) > 1 and all(any(kt.startswith(qt) for kt in key_tokens) for qt in query.tokens):
+        return 60.0 - penalty
+
+    if key_grams is None:
+        key_grams = trigrams(key)
+    similarity = 2 * len(query.grams & key_grams) / (len(query.grams) + len(key_grams))
+    if similarity >= 0.45:
+        return 50.0 * similarity - penalty
+
+    if len(qkey) >= 4 and is_subsequence(qkey.replace('_', ''), key):
+        return 25.0 - penalty
+    return 0.0
+
+
+def min_shared(query) -> int:
+    '''Number of query trigrams an entry must share to be a search candidate'''
+    return max(1, int(len(query.grams) * 0.3))
+
+def candidate_score(query, key) -> float:
+    '''Score of a single key with the same candidate rule as TrigramIndex.search
+    0 when key does not share enough trigrams with the query'''
+    key_grams = trigrams(key)
+    if len(query.grams & key_grams) < min_shared(query):
+        return 0.0
+    return score(query, key, key_grams)
+
+
+class TrigramIndex:
+    '''Collection of text entries indexed by trigrams
+    Search only scores entries sharing enough trigrams with the query, best matches first
+    '''
+
+    def __init__(self):
+        self.keys = [] # normalized key per entry
+        self.payloads = [] # object returned by search per entry
+        self.grams = defaultdict(list) # trigram : entry indexes
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, text, payload=None) -> int:
+        '''Add an entry matched on text, return its index'''
+        key = normalize(text)
+        idx = len(self.keys)
+        self.keys.append(key)
+        self.payloads.append(text if payload is None else payload)
+        for gram in trigrams(key):
+            self.grams[gram].append(idx)
+        return idx
+
+    def search(self, text, limit=None, min_score=MIN_SCORE) -> list:
+        '''Return list of (score, payload) sorted by relevance'''
+        query = text if isinstance(text, Query) else Query(text)
+        if not query.key:
+            return []
+
+        shared = defaultdict(int)
+        for gram in query.grams:
+            for idx in self.grams.get(gram, ()):
+                shared[idx] += 1
+
+        ## candidates must share a part of the query trigrams
+        min_count = min_shared(query)
+        hits = []
+        for idx, count in shared.items():
+            if count < min_count:
+                continue
+            s = score(query, self.keys[idx])
+            if s >= min_score:
+                hits.append((s, idx))
+
+        hits.sort(key=lambda x: (-x[0], x[1]))
+        if limit:
+            hits = hits[:limit]
+        return [(s, self.payloads[idx]) for s, idx in hits]
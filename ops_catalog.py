@@ -0,0 +1,216 @@
+import bpy
+import time
+from array import array
+from collections import defaultdict
+from . import fuzzy_search
+
+_catalog = None # built once per session
+
+class OpsCatalog:
+    '''Column table of all bpy.ops operators with a token index
+    Rows are referenced by index in each column list, token index stores row ids in compact arrays
+    '''
+
+    def __init__(self):
+        self.idnames = [] # python id (ex: object.select_all)
+        self.labels = []
+        self.descriptions = []
+        self.properties = [] # comma separated property identifiers
+        self.sources = [] # source module ('builtin' for C operators)
+        self.name_keys = [] # normalized operator name
+        self.label_keys = [] # normalized label
+        self.tokens = defaultdict(lambda: array('I')) # token : row ids
+
+    def __len__(self):
+        return len(self.idnames)
+
+    def add(self, idname, label, description, properties, source):
+        row = len(self.idnames)
+        self.idnames.append(idname)
+        self.labels.append(label)
+        self.descriptions.append(description)
+        self.properties.append(', '.join(properties))
+        self.sources.append(source)
+        self.name_keys.append(fuzzy_search.normalize(idname.split('.')[-1]))
+        self.label_keys.append(fuzzy_search.normalize(label))
+
+        words = set(fuzzy_search.split_tokens(f'{idname} {label} {description}'))
+        for word in words:
+            self.tokens[word].append(row)
+
+    def rows_for_token(self, token) -> set:
+        '''Return rows containing a word starting with token, or close to it when none'''
+        rows = set()
+        for word, ids in self.tokens.items():
+            if word.startswith(token):
+                rows.update(ids)
+        if rows or len(token) < 3:
+            return rows
+
+        ## typo tolerance on vocabulary
+        query = fuzzy_search.Query(token)
+        for word, ids in self.tokens.items():
+            if fuzzy_search.score(query, word) >= fuzzy_search.MIN_SCORE:
+                rows.update(ids)
+        return rows
+
+    def search(self, text, limit=30) -> list:
+        '''Return list of row ids, best matches first'''
+        query = fuzzy_search.Query(text)
+        if not query.tokens:
+            return []
+
+        candidates = None
+        for token in query.tokens:
+            rows = self.rows_for_token(token)
+            candidates = rows if candidates is None else candidates & rows
+            if not candidates:
+                return []
+
+        ranked = []
+        for row in candidates:
+            s = max(fuzzy_search.score(query, self.name_keys[row]), fuzzy_search.score(query, self.label_keys[row]))
+            if not s:
+                s = 10.0 # only matched in description
+            ranked.append((-s, self.idnames[row], row))
+        ranked.sort()
+        return [row for _s, _idname, row in ranked[:limit]]
+
+    def get_call(self, row) -> str:
+        return f'bpy.ops.{self.idnames[row]}()'
+
+
+def get_operator_source(op) -> str:
+    '''Return top module of the python class defining operator, 'builtin' for C operators'''
+    cls = getattr(bpy.types, op.idname(), None)
+    module = getattr(cls, '__module__', '')
+    if not module or module == 'bpy.types':
+        return 'builtin'
+    return module.split('.')[0]
+
+def build_catalog() -> OpsCatalog:
+    catalog = OpsCatalog()
+    for submod_name in dir(bpy.ops):
+        if submod_name.startswith('_'):
+            continue
+        submod = getattr(bpy.ops, submod_name)
+        for op_name in dir(submod):
+            if op_name.startswith('_'):
+                continue
+            op = getattr(submod, op_name)
+            try:
+                rna = op.get_rna_type()
+            except (KeyError, AttributeError):
+                continue
+            props = [p.identifier for p in rna.properties if p.identifier != 'rna_type']
+            catalog.add(f'{submod_name}.{op_name}', rna.name, rna.description, props, get_operator_source(op))
+    return catalog
+
+def get_catalog(rebuild=False) -> OpsCatalog:
+    global _catalog
+    if _catalog is None or rebuild:
+        start = time.perf_counter()
+        _catalog = build_catalog()
+        print(f'Operators catalog built in {time.perf_counter() - start:.2f}s ({len(_catalog)} operators)')
+    return _catalog
+
+
+class DEV_OT_ops_catalog_insert(bpy.types.Operator):
+    bl_idname = "dev.ops_catalog_insert"
+    bl_label = "Insert Operator Call"
+    bl_description = "Insert operator call at cursor (text editor or console), else copy to clipboard"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    text : bpy.props.StringProperty(options={'SKIP_SAVE'})
+
+    def execute(self, context):
+        area_type = context.area.type if context.area else ''
+        if area_type == 'CONSOLE':
+            bpy.ops.console.insert(text=self.text)
+        elif area_type == 'TEXT_EDITOR' and context.space_data.text:
+            context.space_data.text.write(self.text)
+        else:
+            context.window_manager.clipboard = self.text
+            self.report({'INFO'}, f'Copied: {self.text}')
+        return {"FINISHED"}
+
+
+class DEV_OT_ops_catalog_rebuild(bpy.types.Operator):
+    bl_idname = "dev.ops_catalog_rebuild"
+    bl_label = "Rebuild Operators Catalog"
+    bl_description = "Rebuild operators catalog (to list operators registered since it was built)"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    def execute(self, context):
+        catalog = get_catalog(rebuild=True)
+        self.report({'INFO'}, f'{len(catalog)} operators indexed')
+        return {"FINISHED"}
+
+
+class DEV_OT_ops_catalog_search(bpy.types.Operator):
+    bl_idname = "dev.ops_catalog_search"
+    bl_label = "Search Operators"
+    bl_description = "Search all operators by words in idname, label or description\
+        \nClick a result to insert its call at cursor"
+    bl_options = {"REGISTER"}
+
+    search : bpy.props.StringProperty(name='Search',
+    description='Words to search in operators idname, label and description')
+
+    show_description : bpy.props.BoolProperty(name='Show Descriptions', default=False)
+
+    def invoke(self, context, event):
+        get_catalog()
+        return context.window_manager.invoke_props_dialog(self, width=600)
+
+    def draw(self, context):
+        layout = self.layout
+        catalog = get_catalog()
+
+        row = layout.row(align=True)
+        row.activate_init = True # place cursor in field so user can start taping right away
+        row.prop(self, 'search', text='', icon='VIEWZOOM')
+        row.prop(self, 'show_description', text='', icon='INFO')
+        row.operator('dev.ops_catalog_rebuild', text='', icon='FILE_REFRESH')
+
+        if not self.search:
+            layout.label(text=f'{len(catalog)} operators indexed')
+            return
+
+        rows = catalog.search(self.search)
+        if not rows:
+            layout.label(text='No operator found')
+            return
+
+        col = layout.column(align=True)
+        for r in rows:
+            line = col.row(align=True)
+            line.operator('dev.ops_catalog_insert', text=f'{catalog.labels[r]}  ({catalog.idnames[r]})', emboss=False).text = catalog.get_call(r)
+            line.label(text=catalog.sources[r])
+            if self.show_description and catalog.descriptions[r]:
+                col.label(text=f'    {catalog.descriptions[r]}')
+
+    def execute(self, context):
+        ## Validating the popup inserts the best match
+        catalog = get_catalog()
+        rows = catalog.search(self.search, limit=1)
+        if not rows:
+            self.report({'WARNING'}, f'No operator found for "{self.search}"')
+            return {"CANCELLED"}
+        bpy.ops.dev.ops_catalog_insert(text=catalog.get_call(rows[0]))
+        return {"FINISHED"}
+
+
+classes = (
+DEV_OT_ops_catalog_insert,
+DEV_OT_ops_catalog_rebuild,
+DEV_OT_ops_catalog_search,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
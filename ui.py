@@ -82,7 +82,9 @@ class DEV_PT_dev_tools(bpy.types.Panel):
 
         # Api explore
         col.separator()
-        col.operator('dev.api_search', text='Explore Api', icon='FILE_TEXT')
+        row = col.row(align=True)
+        row.operator('dev.api_search', text='Explore Api', icon='FILE_TEXT')
+        row.operator('dev.ops_catalog_search', text='Search Operators', icon='VIEWZOOM')
 
 
 def register():